@@ -1,9 +1,8 @@
 #!/usr/bin/env python3
 """TW1 LAN Viewer v1.1 — View Two Worlds 1 language files (.lan)
 Full format: Translation Entries + Alias Entries + Quest Entries (dialog trees)"""
-import struct, os, sys, re, tkinter as tk
+import struct, mmap, os, sys, re, array, heapq, threading, tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-from collections import OrderedDict
 
 # Theme
 BG = "#1e1e2e"; BG2 = "#252536"; BG3 = "#2a2a3d"; BG4 = "#32324a"
@@ -11,132 +10,280 @@ FG = "#e0e0e0"; FG_DIM = "#888899"; GREEN = "#50fa7b"; BLUE = "#6272a4"
 ORANGE = "#ffb86c"; RED = "#ff5555"; CYAN = "#8be9fd"; PINK = "#ff79c6"
 YELLOW = "#f1fa8c"; PURPLE = "#bd93f9"
 
-CATEGORIES = OrderedDict([
-    ("DQ_",       ("Dialogs",      "\U0001f4ac", CYAN)),
-    ("Q_",        ("Quests",       "\U0001f4dc", GREEN)),
-    ("NPCName",   ("NPC Names",    "\U0001f464", ORANGE)),
-    ("NPC_",      ("NPC Refs",     "\U0001f465", ORANGE)),
-    ("RUMORS_",   ("Rumors",       "\U0001f4e2", YELLOW)),
-    ("TALK_",     ("Casual Talks", "\U0001f5e3", BLUE)),
-    ("EVENT_",    ("Events",       "\u26a1",     RED)),
-    ("CUTSCENE_", ("Cutscenes",    "\U0001f3ac", PINK)),
-    ("Citizen_",  ("Citizens",     "\U0001f3d8", FG_DIM)),
-    ("Guard_",    ("Guards",       "\U0001f6e1", FG_DIM)),
-    ("QITEM_",    ("Quest Items",  "\U0001f4e6", PURPLE)),
-    ("ING_",      ("Ingredients",  "\U0001f9ea", PURPLE)),
-    ("WP_",       ("Weapons",      "\u2694",     RED)),
-    ("AR_",       ("Armor",        "\U0001f6e1", BLUE)),
-    ("Tip_",      ("Tips",         "\U0001f4a1", YELLOW)),
-    ("Net_",      ("Network",      "\U0001f310", FG_DIM)),
-    ("Skill",     ("Skills",       "\u2728",     CYAN)),
-])
+CATEGORIES = {  # insertion order is the match/display priority
+    "DQ_":       ("Dialogs",      "\U0001f4ac", CYAN),
+    "Q_":        ("Quests",       "\U0001f4dc", GREEN),
+    "NPCName":   ("NPC Names",    "\U0001f464", ORANGE),
+    "NPC_":      ("NPC Refs",     "\U0001f465", ORANGE),
+    "RUMORS_":   ("Rumors",       "\U0001f4e2", YELLOW),
+    "TALK_":     ("Casual Talks", "\U0001f5e3", BLUE),
+    "EVENT_":    ("Events",       "\u26a1",     RED),
+    "CUTSCENE_": ("Cutscenes",    "\U0001f3ac", PINK),
+    "Citizen_":  ("Citizens",     "\U0001f3d8", FG_DIM),
+    "Guard_":    ("Guards",       "\U0001f6e1", FG_DIM),
+    "QITEM_":    ("Quest Items",  "\U0001f4e6", PURPLE),
+    "ING_":      ("Ingredients",  "\U0001f9ea", PURPLE),
+    "WP_":       ("Weapons",      "\u2694",     RED),
+    "AR_":       ("Armor",        "\U0001f6e1", BLUE),
+    "Tip_":      ("Tips",         "\U0001f4a1", YELLOW),
+    "Net_":      ("Network",      "\U0001f310", FG_DIM),
+    "Skill":     ("Skills",       "\u2728",     CYAN),
+}
 
 # ============================================================
 # LAN PARSER — Full Format (BugLord spec)
 # ============================================================
-def _read_dstr(data, pos):
-    sl = struct.unpack_from("<I", data, pos)[0]; pos += 4
-    s = data[pos:pos+sl].decode("ascii", errors="replace"); pos += sl
-    return s, pos
-
-def _read_dstr2(data, pos):
-    sl = struct.unpack_from("<I", data, pos)[0]; pos += 4
-    s = data[pos:pos+sl*2].decode("utf-16-le", errors="replace"); pos += sl*2
-    return s, pos
-
-def _read_arr_pad_int32(data, pos):
-    count = struct.unpack_from("<I", data, pos)[0]; pos += 4
-    pos += 4  # padding
-    vals = []
-    for _ in range(count):
-        vals.append(struct.unpack_from("<i", data, pos)[0]); pos += 4
-    return vals, pos
+_U32 = struct.Struct("<I")
+_unpack_u32 = _U32.unpack_from
+# Fixed field pairs in the dialog record, fetched with one unpack each.
+_unpack_lector_len = struct.Struct("<iI").unpack_from
+_unpack_anims = struct.Struct("<II").unpack_from
+_NEED_SWAP = sys.byteorder == "big"  # file ints are little-endian
+# Most dialogs are terminal with no cam angles: share one empty array
+# instead of allocating a fresh one per empty slot. Never mutated.
+_EMPTY_I32 = array.array("i")
+
+class LazyU16:
+    """A UTF-16LE translation value decoded on first use.
+
+    Holds only (buffer, offset, byte length) until something actually reads
+    the text, so loading a big .lan skips thousands of decodes for entries
+    the GUI never shows. Delegates the handful of str operations the views
+    use; Tk converts via __str__ when rendering.
+    """
+    __slots__ = ("_mv", "_off", "_len", "_cache")
+
+    def __init__(self, mv, off, length):
+        self._mv = mv; self._off = off; self._len = length; self._cache = None
+
+    def _decode(self):
+        s = self._cache
+        if s is None:
+            s = self._cache = str(self._mv[self._off:self._off+self._len],
+                                  "utf-16-le", "replace")
+        return s
+
+    def __str__(self): return self._decode()
+    def __len__(self): return len(self._decode())
+    def __bool__(self): return self._len > 0
+    def __getitem__(self, i): return self._decode()[i]
+    def __contains__(self, sub): return sub in self._decode()
+    def __eq__(self, other):
+        if isinstance(other, (LazyU16, str)): return self._decode() == str(other)
+        return NotImplemented
+    def __hash__(self): return hash(self._decode())
+    def lower(self): return self._decode().lower()
+    def replace(self, old, new): return self._decode().replace(old, new)
+    def count(self, sub): return self._decode().count(sub)
+    def split(self, sep=None, maxsplit=-1): return self._decode().split(sep, maxsplit)
+    def startswith(self, prefix): return self._decode().startswith(prefix)
+
+class TranslationTable:
+    """Translations as parallel key/value lists (SoA).
+
+    Bulk passes (categorize, search) iterate the lists; random access
+    builds the key->index dict once, on first use, so loading never pays
+    for a full dict when the GUI only walks categories.
+    """
+    __slots__ = ("keys", "values", "_index")
+
+    def __init__(self, keys, values):
+        self.keys = keys; self.values = values; self._index = None
+
+    def _idx(self):
+        ix = self._index
+        if ix is None:
+            ix = self._index = {k: i for i, k in enumerate(self.keys)}
+        return ix
+
+    def __len__(self): return len(self.keys)
+    def __contains__(self, key): return key in self._idx()
+    def __getitem__(self, key): return self.values[self._idx()[key]]
+
+    def get(self, key, default=None):
+        i = self._idx().get(key)
+        return self.values[i] if i is not None else default
+
+    def items(self): return zip(self.keys, self.values)
+
+class _Cursor:
+    """Single-pass byte cursor over the mapped file.
+
+    Replaces the pos-threading through free helpers: one mutable position,
+    one bound method per record shape, no tuple returns on the hot path.
+    """
+    __slots__ = ("buf", "pos")
+
+    def __init__(self, buf, pos=0):
+        self.buf = buf; self.pos = pos
+
+    def u32(self):
+        v = _unpack_u32(self.buf, self.pos)[0]; self.pos += 4
+        return v
+
+    def str_ascii(self):
+        buf = self.buf
+        sl = _unpack_u32(buf, self.pos)[0]
+        p = self.pos + 4; self.pos = p + sl
+        return str(buf[p:self.pos], "ascii", "replace")
+
+    def str_utf16(self):
+        sl = _unpack_u32(self.buf, self.pos)[0]
+        p = self.pos + 4; self.pos = p + sl*2
+        return LazyU16(self.buf, p, sl*2)
+
+    def lector_ascii(self):
+        # i32 lector immediately followed by a length-prefixed ascii string
+        buf = self.buf
+        lector, sl = _unpack_lector_len(buf, self.pos)
+        p = self.pos + 8; self.pos = p + sl
+        return lector, str(buf[p:self.pos], "ascii", "replace")
+
+    def arr_pad_int32(self):
+        count = _unpack_u32(self.buf, self.pos)[0]
+        p = self.pos + 8  # count + padding
+        if not count:
+            self.pos = p
+            return _EMPTY_I32
+        self.pos = p + 4*count
+        vals = array.array("i")
+        vals.frombytes(self.buf[p:self.pos])
+        if _NEED_SWAP: vals.byteswap()
+        return vals
+
+    def anims(self):
+        pair = _unpack_anims(self.buf, self.pos); self.pos += 8
+        return pair
+
+def _intern_short(s):
+    # Collapse duplicate short ids (the same NPC/cue recurs across quests);
+    # long strings are usually unique sentences, not worth the intern probe.
+    return sys.intern(s) if len(s) < 64 else s
+
+class Dialog:
+    """One dialog-tree node; slotted record, about half the size of the
+    8-key dict it replaces and with direct attribute access."""
+    __slots__ = ("lector", "trans_id", "sound_cue", "next", "flags",
+                 "cam_angles", "anim1", "anim2")
+
+    def __init__(self, lector, trans_id, sound_cue, next_dlgs, flags,
+                 cam_angles, anim1, anim2):
+        self.lector = lector; self.trans_id = trans_id
+        self.sound_cue = sound_cue; self.next = next_dlgs
+        self.flags = flags; self.cam_angles = cam_angles
+        self.anim1 = anim1; self.anim2 = anim2
+
+def _read_dialog(c):
+    lector, trans_id = c.lector_ascii()
+    sound_cue = _intern_short(c.str_ascii())
+    next_dlgs = c.arr_pad_int32()
+    flags = c.u32()
+    cam_angles = c.arr_pad_int32()
+    anim1, anim2 = c.anims()
+    return Dialog(lector, _intern_short(trans_id.removeprefix("translate")),
+                  sound_cue, next_dlgs, flags, cam_angles, anim1, anim2)
 
 def parse_lan(filepath):
     with open(filepath, "rb") as f:
-        data = f.read()
-    if data[:4] != b"LAN\x00":
-        raise ValueError("Not a valid LAN file (missing LAN\\0 header)")
-    version = struct.unpack_from("<I", data, 4)[0]
-    pos = 8
-    tr_count = struct.unpack_from("<I", data, pos)[0]; pos += 4
-    translations = OrderedDict()
-    for _ in range(tr_count):
-        key, pos = _read_dstr(data, pos)
-        val, pos = _read_dstr2(data, pos)
-        clean = key[9:] if key.startswith("translate") else key
-        translations[clean] = val
-    aliases = OrderedDict()
-    if pos < len(data) - 4:
-        try:
-            al_count = struct.unpack_from("<I", data, pos)[0]; pos += 4
-            for _ in range(al_count):
-                akey, pos = _read_dstr(data, pos)
-                aval, pos = _read_dstr(data, pos)
-                ck = akey[9:] if akey.startswith("translate") else akey
-                cv = aval[9:] if aval.startswith("translate") else aval
-                aliases[ck] = cv
-        except Exception:
-            pass
-    quests = OrderedDict()
-    if pos < len(data) - 4:
-        try:
-            q_count = struct.unpack_from("<I", data, pos)[0]; pos += 4
-            for _ in range(q_count):
-                qid, pos = _read_dstr(data, pos)
-                qid_clean = qid[9:] if qid.startswith("translate") else qid
-                dialog_count = struct.unpack_from("<I", data, pos)[0]; pos += 4
-                pos += 4
-                dialogs = []
-                for _ in range(dialog_count):
-                    lector = struct.unpack_from("<i", data, pos)[0]; pos += 4
-                    trans_id, pos = _read_dstr(data, pos)
-                    sound_cue, pos = _read_dstr(data, pos)
-                    next_dlgs, pos = _read_arr_pad_int32(data, pos)
-                    flags = struct.unpack_from("<I", data, pos)[0]; pos += 4
-                    cam_angles, pos = _read_arr_pad_int32(data, pos)
-                    anim1 = struct.unpack_from("<I", data, pos)[0]; pos += 4
-                    anim2 = struct.unpack_from("<I", data, pos)[0]; pos += 4
-                    tid_clean = trans_id[9:] if trans_id.startswith("translate") else trans_id
-                    dialogs.append({"lector": lector, "trans_id": tid_clean,
-                        "sound_cue": sound_cue, "next": next_dlgs,
-                        "flags": flags, "cam_angles": cam_angles,
-                        "anim1": anim1, "anim2": anim2})
-                quests[qid_clean] = dialogs
-        except Exception:
-            pass
-    return version, translations, aliases, quests
-
-def categorize(entries):
-    cats = OrderedDict()
+        # Map the file instead of read(): no full userspace copy, pages load on demand
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    mv = memoryview(data)
+    try:
+        if data[:4] != b"LAN\x00":
+            raise ValueError("Not a valid LAN file (missing LAN\\0 header)")
+        version = _unpack_u32(data, 4)[0]
+        size = len(data)
+        c = _Cursor(mv, 8)
+        tkeys = []; tvals = []
+        ka = tkeys.append; va = tvals.append
+        for _ in range(c.u32()):
+            ka(_intern_short(c.str_ascii().removeprefix("translate")))
+            va(c.str_utf16())
+        translations = TranslationTable(tkeys, tvals)
+        aliases = {}
+        if c.pos < size - 4:
+            al_count = c.u32()
+            # Sanity-check the peeked count before looping: every alias is at
+            # least two length prefixes (8 bytes), so a count beyond that is
+            # trailing garbage, not an alias section.
+            if al_count <= (size - c.pos) // 8:
+                # Loop, not a comprehension: a truncated file keeps the
+                # aliases read so far, matching the quests section below.
+                try:
+                    for _ in range(al_count):
+                        ck = c.str_ascii().removeprefix("translate")
+                        aliases[ck] = c.str_ascii().removeprefix("translate")
+                except Exception:
+                    pass
+        quests = {}
+        if c.pos < size - 4:
+            q_count = c.u32()
+            if q_count <= (size - c.pos) // 8:  # min 8 bytes per quest record
+                try:
+                    for _ in range(q_count):
+                        qid_clean = c.str_ascii().removeprefix("translate")
+                        dialog_count = c.u32()
+                        c.pos += 4  # padding
+                        quests[qid_clean] = [_read_dialog(c)
+                                             for _ in range(dialog_count)]
+                except Exception:
+                    pass
+        # The mapping stays open: LazyU16 values reference it until decoded.
+        return version, translations, aliases, quests
+    except Exception:
+        mv.release(); data.close()
+        raise
+
+# One hash on the first "_" token replaces the prefix scan; prefixes that
+# don't end in "_" (NPCName, Skill) still match bare keys via startswith.
+_TOKEN_LABEL = {}
+for _prefix, (_label, _, _) in CATEGORIES.items():
+    _TOKEN_LABEL[_prefix.rstrip("_")] = _label
+_BARE_PREFIXES = tuple((p, li[0]) for p, li in CATEGORIES.items()
+                       if not p.endswith("_"))
+
+_DQ_MATCH = re.compile(r"DQ_(\d+)").match  # re.match anchors at start already
+_Q_MATCH = re.compile(r"Q_(\d+)").match
+_PREVIEW_TBL = str.maketrans({"\n": " ", "\r": " ", "\t": " "})
+_HERO_SUFFIX = re.compile(r"CLOSE|QC|QNS|QS").search  # hero-spoken dialog keys
+_NUMPFX_SUB = re.compile(r"^\d+_?").sub
+
+def _id_digits(key, start):
+    # Length of the digit run at key[start:] — the quest number.
+    i = start; n = len(key)
+    while i < n and key[i].isdigit(): i += 1
+    return i
+
+def categorize_full(entries):
+    """One fused pass over the table: category buckets plus the per-quest
+    Dialogs/Quests groups the tree view needs, instead of a categorize
+    pass followed by two subcategorize re-iterations."""
+    cats = {}
     for li in CATEGORIES.values(): cats[li[0]] = []
     cats["Other"] = []
+    dq_groups = {}; q_groups = {}
+    get_label = _TOKEN_LABEL.get
     for key, val in entries.items():
-        placed = False
-        for prefix, (label, _, _) in CATEGORIES.items():
-            if key.startswith(prefix):
-                cats[label].append((key, val)); placed = True; break
-        if not placed:
-            cats["Other"].append((key, val))
-    return OrderedDict((k, v) for k, v in cats.items() if v)
-
-def subcategorize_dialogs(items):
-    groups = OrderedDict()
-    for key, val in items:
-        m = re.match(r"^DQ_(\d+)", key)
-        qid = f"Q_{m.group(1)}" if m else "Unknown"
-        if qid not in groups: groups[qid] = []
-        groups[qid].append((key, val))
-    return groups
-
-def subcategorize_quests(items):
-    groups = OrderedDict()
-    for key, val in items:
-        m = re.match(r"^Q_(\d+)", key)
-        qid = f"Q_{m.group(1)}" if m else key
-        if qid not in groups: groups[qid] = []
-        groups[qid].append((key, val))
-    return groups
+        tok, sep, _ = key.partition("_")
+        label = get_label(tok) if sep else None
+        if label is None:
+            for prefix, plabel in _BARE_PREFIXES:
+                if key.startswith(prefix):
+                    label = plabel; break
+            else:
+                label = "Other"
+        entry = (key, val)
+        cats[label].append(entry)
+        if label == "Dialogs":
+            i = _id_digits(key, 3)
+            qid = "Q_" + key[3:i] if i > 3 else "Unknown"
+            dq_groups.setdefault(qid, []).append(entry)
+        elif label == "Quests":
+            i = _id_digits(key, 2)
+            qid = key[:i] if i > 2 else key
+            q_groups.setdefault(qid, []).append(entry)
+    cats = {k: v for k, v in cats.items() if v}
+    return cats, {"Dialogs": dq_groups, "Quests": q_groups}
 
 # ============================================================
 # APP
@@ -149,12 +296,28 @@ class App:
         self.root.configure(bg=BG)
         self.root.minsize(800, 500)
         self.font_size = 12
-        self.translations = OrderedDict()
-        self.aliases = OrderedDict()
-        self.quests = OrderedDict()
-        self.categories = OrderedDict()
+        self.translations = {}
+        self.aliases = {}
+        self.quests = {}
+        self.categories = {}
+        self.cat_groups = {"Dialogs": {}, "Quests": {}}
         self.tree_map = {}
+        # label -> (icon, color), replacing linear CATEGORIES scans per row
+        self._cat_by_label = {v[0]: (v[1], v[2]) for v in CATEGORIES.values()}
         self.compare_translations = None
+        self._diff = {}  # key -> 0 identical / 1 different; absent = missing
+        self._quest_name_cache = {}
+        self._quest_label_cache = {}
+        self._search_tokens = None; self._search_rows = None
+        self._search_cache = {}
+        self._search_after = None
+        self._last_query = ""; self._last_hits = []; self._last_truncated = False
+        self._quest_tree_frames = {}  # qid -> built bubble frame, LRU, max 8
+        self._results_frame = None; self._result_pool = []  # search row pool
+        self._results_live = False  # results view currently displayed?
+        self._expanded_tids = set()
+        self._stats = (0, 0, 0, 0)  # (dialog nodes, hero lines, cues, speakers)
+        self._active_canvas = None
         self.filepath = None; self.compare_path = None
         self._build_ui(); self._auto_load(); self.root.mainloop()
 
@@ -180,7 +343,8 @@ class App:
         se = tk.Entry(sb, textvariable=self.search_var, bg=BG3, fg=FG,
                       insertbackground=FG, font=("Segoe UI", 11), bd=0)
         se.pack(side="left", fill="x", expand=True, padx=6)
-        se.bind("<Return>", lambda e: self._search())
+        se.bind("<Return>", lambda e: self._search_now())
+        se.bind("<KeyRelease>", self._queue_search)
         self.search_lbl = tk.Label(sb, text="", bg=BG2, fg=GREEN, font=("Segoe UI", 9))
         self.search_lbl.pack(side="right")
         pw = tk.PanedWindow(self.root, orient="horizontal", bg=BG, sashwidth=4, sashrelief="flat")
@@ -197,8 +361,36 @@ class App:
         scr.pack(side="right", fill="y"); self.tree.pack(fill="both", expand=True)
         self.tree.bind("<<TreeviewSelect>>", self._on_select)
         self.tree.bind("<<TreeviewOpen>>", self._on_expand)
+        # One global wheel binding for the life of the app; _scrollable only
+        # updates which canvas is under the pointer.
+        self.root.bind_all("<MouseWheel>", self._on_mousewheel)
         right = tk.Frame(pw, bg=BG); pw.add(right)
         self.detail = tk.Frame(right, bg=BG); self.detail.pack(fill="both", expand=True)
+        # Persistent view chrome: one header strip, one canvas scroller and
+        # one text pane live for the whole session. View switches swap their
+        # contents instead of destroying and recreating the containers —
+        # widget teardown/creation is the expensive part of Tk.
+        self._header_area = tk.Frame(self.detail, bg=BG)
+        self._header_area.pack(fill="x")
+        self._body = tk.Frame(self.detail, bg=BG)
+        self._body.pack(fill="both", expand=True)
+        self._canvas_sb = ttk.Scrollbar(self._body, orient="vertical")
+        self._canvas = tk.Canvas(self._body, bg=BG, highlightthickness=0, bd=0,
+                                 yscrollcommand=self._canvas_sb.set)
+        self._canvas_sb.config(command=self._canvas.yview)
+        self._scroll_frame = tk.Frame(self._canvas, bg=BG)
+        self._scroll_frame.bind("<Configure>", lambda e: self._canvas.configure(
+            scrollregion=self._canvas.bbox("all")))
+        self._canvas.create_window((0, 0), window=self._scroll_frame, anchor="nw")
+        self._canvas.bind("<Enter>",
+                          lambda e: setattr(self, "_active_canvas", self._canvas))
+        self._canvas.bind("<Leave>",
+                          lambda e: setattr(self, "_active_canvas", None))
+        self._text_sb = ttk.Scrollbar(self._body, orient="vertical")
+        self._text = tk.Text(self._body, bg=BG, fg=FG, bd=0,
+                             highlightthickness=0, padx=10, pady=6,
+                             cursor="arrow", yscrollcommand=self._text_sb.set)
+        self._text_sb.config(command=self._text.yview)
         self._show_welcome()
 
     def _resize(self, d):
@@ -206,6 +398,11 @@ class App:
         self.fs_lbl.config(text=str(self.font_size))
         ttk.Style().configure("Dark.Treeview", font=("Segoe UI", self.font_size-1),
                                rowheight=max(22, self.font_size*2))
+        self._drop_quest_tree_cache()  # cached bubbles carry the old font
+
+    def _drop_quest_tree_cache(self):
+        for f in self._quest_tree_frames.values(): f.destroy()
+        self._quest_tree_frames.clear()
 
     def _auto_load(self):
         d = os.path.dirname(os.path.abspath(__file__))
@@ -228,21 +425,82 @@ class App:
         try:
             _, tr, _, _ = parse_lan(p)
             self.compare_translations = tr; self.compare_path = p
+            self._rebuild_diff()
             self.status_lbl.config(text=self.status_lbl.cget("text") +
                 f"  |  \u2194 {os.path.basename(p)}")
         except Exception as e:
             messagebox.showerror("Error", f"Compare failed:\n{e}")
 
+    def _rebuild_diff(self):
+        # Verdicts only change when either file changes; compare every key
+        # once here instead of on each entry view.
+        tr = self.translations
+        self._diff = {}
+        if self.compare_translations:
+            for k, cv in self.compare_translations.items():
+                v = tr.get(k)
+                if v is not None:
+                    self._diff[k] = 0 if cv == v else 1
+
     def _do_load(self, path):
+        # Parse off the Tk thread so the event loop stays responsive; the
+        # worker posts results back onto the main thread via after().
+        self.root.title("TW1 LAN Viewer v1.1 \u2014 Loading...")
+        self.status_lbl.config(text=f"Loading {os.path.basename(path)}...")
+        threading.Thread(target=self._parse_worker, args=(path,),
+                         daemon=True).start()
+
+    def _parse_worker(self, path):
         try:
-            self.root.title("TW1 LAN Viewer v1.1 \u2014 Loading...")
-            self.root.update()
-            ver, tr, al, qu = parse_lan(path)
+            result = parse_lan(path)
+        except Exception as e:
+            self.root.after(0, self._load_failed, str(e))
+            return
+        self.root.after(0, self._apply_load, path, result)
+
+    def _load_failed(self, msg):
+        self.root.title("TW1 LAN Viewer v1.1")
+        self.status_lbl.config(text="")
+        messagebox.showerror("Error", f"Load failed:\n{msg}")
+
+    def _apply_load(self, path, result):
+        try:
+            ver, tr, al, qu = result
             self.translations = tr; self.aliases = al; self.quests = qu
-            self.filepath = path; self.categories = categorize(tr)
+            self.filepath = path
+            self.categories, self.cat_groups = categorize_full(tr)
+            # Quest-tree ids resolve to display names over and over in tree
+            # labels and headers; do the DQ_->Q_ mapping once per load.
+            self._quest_name_cache = {
+                qid: tr.get("Q_" + qid[3:] if qid.startswith("DQ_") else qid, "")
+                for qid in qu}
+            # Tree labels reuse one preformatted "qid: name" string per
+            # quest instead of reformatting per row/render.
+            self._quest_label_cache = {
+                qid: (f"{qid}: {n}" if n else qid)
+                for qid, n in self._quest_name_cache.items()}
+            for qid in self.cat_groups["Dialogs"]:
+                n = tr.get(qid, "")
+                self._quest_label_cache.setdefault(
+                    qid, f"{qid}: {n}" if n else qid)
+            self._search_tokens = None; self._search_rows = None
+            self._search_cache.clear()
+            self._last_query = ""; self._last_hits = []
+            self._drop_quest_tree_cache()
+            self._rebuild_diff()
+            # One pass over every dialog node; _build_tree, the status line
+            # and _show_stats all read the cached aggregates.
+            td = hero = cues = 0
+            lectors = set()
+            for dlgs in qu.values():
+                td += len(dlgs)
+                for d in dlgs:
+                    lectors.add(d.lector)
+                    if d.lector == 1: hero += 1
+                    if d.sound_cue: cues += 1
+            self._stats = (td, hero, cues, len(lectors))
             self._build_tree()
             name = os.path.basename(path)
-            td = sum(len(d) for d in qu.values())
             self.root.title(f"TW1 LAN Viewer v1.1 \u2014 {name}")
             parts = [f"v{ver}", f"{len(tr):,} texts", f"{len(al)} aliases",
                      f"{len(qu)} quests", f"{td:,} dialog nodes"]
@@ -253,57 +511,61 @@ class App:
 
     # ---- TREE ----
     def _build_tree(self):
+        # Only top-level rows are created here; everything below them is a
+        # placeholder filled in by _on_expand, so load time is O(categories)
+        # instead of O(entries).
         self.tree.delete(*self.tree.get_children()); self.tree_map.clear()
+        self._expanded_tids.clear()
         for cat_name, items in self.categories.items():
-            icon = "\U0001f4c1"
-            for prefix, (label, ic, _) in CATEGORIES.items():
-                if label == cat_name: icon = ic; break
+            icon = self._cat_by_label.get(cat_name, ("\U0001f4c1", FG_DIM))[0]
             tid = self.tree.insert("", "end",
                 text=f"{icon}  {cat_name}  ({len(items):,})", open=False)
             self.tree_map[tid] = ("__cat__", cat_name)
-            if cat_name == "Dialogs":
-                groups = subcategorize_dialogs(items)
-                for qid, gitems in groups.items():
-                    qname = self.translations.get(qid, "")
-                    label = f"{qid}: {qname}" if qname else qid
-                    stid = self.tree.insert(tid, "end",
-                        text=f"\U0001f4dc  {label}  ({len(gitems)})", open=False)
-                    self.tree_map[stid] = ("__dq_group__", gitems)
-                    if gitems: self.tree.insert(stid, "end", text="...", tags=("placeholder",))
-            elif cat_name == "Quests":
-                groups = subcategorize_quests(items)
-                for qid, gitems in groups.items():
-                    qname = ""
-                    for k, v in gitems:
-                        if "_" not in k[2:]: qname = v; break
-                    label = f"{qid}: {qname}" if qname else qid
-                    stid = self.tree.insert(tid, "end", text=f"\U0001f4dc  {label}", open=False)
-                    self.tree_map[stid] = ("__q_group__", gitems)
-                    if len(gitems) > 1: self.tree.insert(stid, "end", text="...", tags=("placeholder",))
-            else:
-                if items: self.tree.insert(tid, "end", text="...", tags=("placeholder",))
+            if items: self.tree.insert(tid, "end", text="...", tags=("placeholder",))
         if self.aliases:
             tid = self.tree.insert("", "end",
                 text=f"\U0001f517  Aliases  ({len(self.aliases)})", open=False)
             self.tree_map[tid] = ("__aliases__", None)
             self.tree.insert(tid, "end", text="...", tags=("placeholder",))
         if self.quests:
-            td = sum(len(d) for d in self.quests.values())
+            td = self._stats[0]
             tid = self.tree.insert("", "end",
                 text=f"\U0001f3ad  Dialog Trees  ({len(self.quests)} quests, {td:,} nodes)", open=False)
             self.tree_map[tid] = ("__quest_trees__", None)
-            for qid, dialogs in self.quests.items():
-                qname = self.translations.get(qid.replace("DQ_", "Q_"), "")
-                label = f"{qid}: {qname}" if qname else qid
-                stid = self.tree.insert(tid, "end",
-                    text=f"\U0001f4ac  {label}  ({len(dialogs)} nodes)", open=False)
-                self.tree_map[stid] = ("__quest_tree__", (qid, dialogs))
-                if dialogs: self.tree.insert(stid, "end", text="...", tags=("placeholder",))
+            self.tree.insert(tid, "end", text="...", tags=("placeholder",))
+
+    def _expand_dialog_groups(self, tid):
+        for qid, gitems in self.cat_groups["Dialogs"].items():
+            label = self._quest_label_cache.get(qid, qid)
+            stid = self.tree.insert(tid, "end",
+                text=f"\U0001f4dc  {label}  ({len(gitems)})", open=False)
+            self.tree_map[stid] = ("__dq_group__", gitems)
+            if gitems: self.tree.insert(stid, "end", text="...", tags=("placeholder",))
+
+    def _expand_quest_groups(self, tid):
+        for qid, gitems in self.cat_groups["Quests"].items():
+            qname = ""
+            for k, v in gitems:
+                if "_" not in k[2:]: qname = v; break
+            label = f"{qid}: {qname}" if qname else qid
+            stid = self.tree.insert(tid, "end", text=f"\U0001f4dc  {label}", open=False)
+            self.tree_map[stid] = ("__q_group__", gitems)
+            if len(gitems) > 1: self.tree.insert(stid, "end", text="...", tags=("placeholder",))
+
+    def _expand_quest_trees(self, tid):
+        for qid, dialogs in self.quests.items():
+            label = self._quest_label_cache.get(qid, qid)
+            stid = self.tree.insert(tid, "end",
+                text=f"\U0001f4ac  {label}  ({len(dialogs)} nodes)", open=False)
+            self.tree_map[stid] = ("__quest_tree__", (qid, dialogs))
+            if dialogs: self.tree.insert(stid, "end", text="...", tags=("placeholder",))
 
     def _on_expand(self, event):
         try:
             tid = self.tree.focus()
-            if not tid: return
+            # Re-opening an already-expanded row skips the placeholder probe
+            # (two Tk round-trips) entirely.
+            if not tid or tid in self._expanded_tids: return
             ch = self.tree.get_children(tid)
             if len(ch) != 1: return
             if "placeholder" not in self.tree.item(ch[0], "tags"): return
@@ -311,35 +573,60 @@ class App:
             info = self.tree_map.get(tid)
             if not info: return
             kind, data = info
-            if kind == "__cat__":
-                for key, val in self.categories.get(data, []):
-                    p = val[:70].replace("\n", " ")
-                    ctid = self.tree.insert(tid, "end", text=f"  {key}:  {p}")
-                    self.tree_map[ctid] = ("__entry__", (key, val))
-            elif kind == "__dq_group__":
-                for key, val in data:
-                    p = val[:60].replace("\n", " ")
-                    ctid = self.tree.insert(tid, "end", text=f"  {p}")
-                    self.tree_map[ctid] = ("__entry__", (key, val))
-            elif kind == "__q_group__":
-                for key, val in data:
-                    s = key.split("_", 2)[-1] if "_" in key[2:] else ""
-                    s = re.sub(r"^\d+_?", "", s) or "Name"
-                    p = val[:60].replace("\n", " ")
-                    ctid = self.tree.insert(tid, "end", text=f"  [{s}] {p}")
-                    self.tree_map[ctid] = ("__entry__", (key, val))
-            elif kind == "__aliases__":
-                for akey, aval in self.aliases.items():
-                    ctid = self.tree.insert(tid, "end", text=f"  {akey}  \u2192  {aval}")
-                    self.tree_map[ctid] = ("__alias__", (akey, aval))
-            elif kind == "__quest_tree__":
-                qid, dialogs = data
-                for i, d in enumerate(dialogs):
-                    text = self.translations.get(d["trans_id"], "")
-                    preview = text[:55].replace("\n", " ") if text else f"[{d['trans_id']}]"
-                    speaker = "Hero" if d["lector"] == 1 else f"NPC#{d['lector']}"
-                    ctid = self.tree.insert(tid, "end", text=f"  [{i}] {speaker}: {preview}")
-                    self.tree_map[ctid] = ("__dialog_node__", (qid, i, d))
+            # Detach the row for the bulk insert: Tk does one relayout on
+            # reattach instead of one per inserted child.
+            parent = self.tree.parent(tid); index = self.tree.index(tid)
+            self.tree.detach(tid)
+            try:
+                if kind == "__cat__" and data == "Dialogs":
+                    self._expand_dialog_groups(tid)
+                elif kind == "__cat__" and data == "Quests":
+                    self._expand_quest_groups(tid)
+                elif kind == "__quest_trees__":
+                    self._expand_quest_trees(tid)
+                elif kind == "__cat__":
+                    insert = self.tree.insert; pending = {}
+                    for key, val in self.categories.get(data, []):
+                        p = val[:70].translate(_PREVIEW_TBL)
+                        pending[insert(tid, "end", text=f"  {key}:  {p}")] = \
+                            ("__entry__", (key, val))
+                    self.tree_map.update(pending)
+                elif kind == "__dq_group__":
+                    insert = self.tree.insert; pending = {}
+                    for key, val in data:
+                        p = val[:60].translate(_PREVIEW_TBL)
+                        pending[insert(tid, "end", text=f"  {p}")] = \
+                            ("__entry__", (key, val))
+                    self.tree_map.update(pending)
+                elif kind == "__q_group__":
+                    insert = self.tree.insert; pending = {}
+                    for key, val in data:
+                        s = key.split("_", 2)[-1] if "_" in key[2:] else ""
+                        s = _NUMPFX_SUB("", s) or "Name"
+                        p = val[:60].translate(_PREVIEW_TBL)
+                        pending[insert(tid, "end", text=f"  [{s}] {p}")] = \
+                            ("__entry__", (key, val))
+                    self.tree_map.update(pending)
+                elif kind == "__aliases__":
+                    insert = self.tree.insert; pending = {}
+                    for akey, aval in self.aliases.items():
+                        pending[insert(tid, "end", text=f"  {akey}  \u2192  {aval}")] = \
+                            ("__alias__", (akey, aval))
+                    self.tree_map.update(pending)
+                elif kind == "__quest_tree__":
+                    qid, dialogs = data
+                    insert = self.tree.insert; pending = {}
+                    for i, d in enumerate(dialogs):
+                        text = self.translations.get(d.trans_id, "")
+                        preview = text[:55].translate(_PREVIEW_TBL) if text else f"[{d.trans_id}]"
+                        speaker = "Hero" if d.lector == 1 else f"NPC#{d.lector}"
+                        pending[insert(tid, "end", text=f"  [{i}] {speaker}: {preview}")] = \
+                            ("__dialog_node__", (qid, i, d))
+                    self.tree_map.update(pending)
+            finally:
+                self.tree.move(tid, parent, index)
+                self.tree.item(tid, open=True)
+                self._expanded_tids.add(tid)
         except Exception as e:
             print(f"Expand error: {e}")
 
@@ -364,24 +651,40 @@ class App:
 
     # ---- SHARED UI ----
     def _clear(self):
-        for w in self.detail.winfo_children(): w.destroy()
+        self._active_canvas = None
+        self._results_live = False
+        for w in self._header_area.winfo_children(): w.destroy()
+        cached = set(self._quest_tree_frames.values())
+        if self._results_frame is not None:
+            cached.add(self._results_frame)
+        for w in self._scroll_frame.winfo_children():
+            # Cached quest-tree bodies and the search row pool are only
+            # hidden; they are reused on the next visit.
+            if w in cached: w.pack_forget()
+            else: w.destroy()
+        keep = (self._canvas, self._canvas_sb, self._text, self._text_sb)
+        for w in self._body.winfo_children():
+            if w not in keep: w.destroy()
+        self._canvas_sb.pack_forget(); self._canvas.pack_forget()
+        self._text_sb.pack_forget(); self._text.pack_forget()
+
+    def _on_mousewheel(self, event):
+        c = self._active_canvas
+        if c is not None and c.winfo_exists():
+            c.yview_scroll(-1*(event.delta//120), "units")
 
     def _scrollable(self):
-        canvas = tk.Canvas(self.detail, bg=BG, highlightthickness=0, bd=0)
-        sb = ttk.Scrollbar(self.detail, orient="vertical", command=canvas.yview)
-        frame = tk.Frame(canvas, bg=BG)
-        frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-        canvas.create_window((0, 0), window=frame, anchor="nw")
-        canvas.configure(yscrollcommand=sb.set)
-        sb.pack(side="right", fill="y"); canvas.pack(fill="both", expand=True)
-        canvas.bind_all("<MouseWheel>", lambda e: canvas.yview_scroll(-1*(e.delta//120), "units"))
-        return canvas, frame
+        self._canvas_sb.pack(side="right", fill="y")
+        self._canvas.pack(fill="both", expand=True)
+        self._canvas.yview_moveto(0)
+        self._active_canvas = self._canvas
+        return self._canvas, self._scroll_frame
 
     # ---- VIEWS ----
     def _show_welcome(self):
         self._clear()
         fs = self.font_size
-        f = tk.Frame(self.detail, bg=BG); f.pack(expand=True)
+        f = tk.Frame(self._body, bg=BG); f.pack(expand=True)
         tk.Label(f, text="TW1 LAN Viewer", font=("Segoe UI", fs+6, "bold"),
                  bg=BG, fg=FG).pack(pady=(40, 8))
         tk.Label(f, text="Two Worlds 1 Language File Viewer",
@@ -398,7 +701,7 @@ class App:
                  bg=BG, fg=FG).pack(anchor="w", padx=16, pady=(16, 4))
         tk.Label(frame, text=os.path.basename(self.filepath),
                  font=("Segoe UI", fs), bg=BG, fg=FG_DIM).pack(anchor="w", padx=16)
-        td = sum(len(d) for d in self.quests.values())
+        td, hero, cues, speakers = self._stats
         sf = tk.Frame(frame, bg=BG); sf.pack(anchor="w", padx=16, pady=(8, 4))
         for lb, vl, cl in [("Texts", f"{len(self.translations):,}", GREEN),
                             ("Aliases", str(len(self.aliases)), BLUE),
@@ -410,74 +713,88 @@ class App:
         tk.Label(frame, text="Text Categories:", font=("Segoe UI", fs, "bold"),
                  bg=BG, fg=FG).pack(anchor="w", padx=16, pady=(0, 4))
         mx = max((len(v) for v in self.categories.values()), default=1)
+        # All bars and their labels go on one canvas: three draw items per
+        # row instead of three widgets plus a pack_propagate(False) frame.
+        rowh = 22
+        bars = tk.Canvas(frame, bg=BG, highlightthickness=0, width=560,
+                         height=rowh * len(self.categories))
+        bars.pack(anchor="w", padx=16, pady=2)
+        y = 0
         for cn, items in self.categories.items():
-            color = FG_DIM
-            for prefix, (label, _, c) in CATEGORIES.items():
-                if label == cn: color = c; break
-            row = tk.Frame(frame, bg=BG); row.pack(fill="x", padx=16, pady=2)
-            tk.Label(row, text=cn, font=("Segoe UI", fs-1), bg=BG, fg=FG, width=16, anchor="e").pack(side="left")
+            color = self._cat_by_label.get(cn, (None, FG_DIM))[1]
+            cy = y + rowh // 2
+            bars.create_text(140, cy, text=cn, anchor="e", fill=FG,
+                             font=("Segoe UI", fs-1))
             bw = max(4, int(300 * len(items) / mx))
-            bar = tk.Frame(row, bg=color, height=18, width=bw)
-            bar.pack(side="left", padx=(8, 4)); bar.pack_propagate(False)
-            tk.Label(row, text=f"{len(items):,}", font=("Segoe UI", fs-1, "bold"),
-                     bg=BG, fg=color).pack(side="left")
+            bars.create_rectangle(148, y+2, 148+bw, y+rowh-2, fill=color, outline="")
+            bars.create_text(154+bw, cy, text=f"{len(items):,}", anchor="w",
+                             fill=color, font=("Segoe UI", fs-1, "bold"))
+            y += rowh
         if self.quests:
             tk.Frame(frame, bg=FG_DIM, height=1).pack(fill="x", padx=16, pady=8)
             tk.Label(frame, text="Dialog Tree Stats:", font=("Segoe UI", fs, "bold"),
                      bg=BG, fg=FG).pack(anchor="w", padx=16, pady=(0, 4))
-            lectors = set()
-            cues = 0
-            for dlgs in self.quests.values():
-                for d in dlgs:
-                    lectors.add(d["lector"])
-                    if d["sound_cue"]: cues += 1
-            hero = sum(1 for dlgs in self.quests.values() for d in dlgs if d["lector"] == 1)
             npc = td - hero
-            tk.Label(frame, text=f"{len(lectors)} speakers  |  Hero: {hero:,}  |  NPC: {npc:,}  |  {cues:,} sound cues",
+            tk.Label(frame, text=f"{speakers} speakers  |  Hero: {hero:,}  |  NPC: {npc:,}  |  {cues:,} sound cues",
                      font=("Segoe UI", fs-1), bg=BG, fg=CYAN).pack(anchor="w", padx=16)
 
+    def _text_pane(self, wrap="none"):
+        # One Text widget with tagged runs instead of a Frame+Labels per row:
+        # constant widget count no matter how many entries are shown. The
+        # widget itself is the persistent one from _build_ui, re-shown here.
+        fs = self.font_size
+        txt = self._text
+        txt.configure(state="normal", wrap=wrap, font=("Segoe UI", fs-1))
+        txt.delete("1.0", "end")
+        for tag in txt.tag_names():
+            if tag != "sel": txt.tag_delete(tag)
+        self._text_sb.pack(side="right", fill="y")
+        txt.pack(fill="both", expand=True)
+        txt.yview_moveto(0)
+        return txt
+
     def _show_category(self, cat_name):
         self._clear(); fs = self.font_size
         items = self.categories.get(cat_name, [])
-        color = FG_DIM
-        for prefix, (label, _, c) in CATEGORIES.items():
-            if label == cat_name: color = c; break
-        hdr = tk.Frame(self.detail, bg=BG3, padx=12, pady=8); hdr.pack(fill="x")
+        color = self._cat_by_label.get(cat_name, (None, FG_DIM))[1]
+        hdr = tk.Frame(self._header_area, bg=BG3, padx=12, pady=8); hdr.pack(fill="x")
         tk.Label(hdr, text=cat_name, font=("Segoe UI", fs+2, "bold"), bg=BG3, fg=color).pack(anchor="w")
         tk.Label(hdr, text=f"{len(items):,} entries", font=("Segoe UI", fs-1), bg=BG3, fg=FG_DIM).pack(anchor="w")
-        _, frame = self._scrollable()
-        for i, (key, val) in enumerate(items[:200]):
-            bg = BG2 if i % 2 == 0 else BG
-            row = tk.Frame(frame, bg=bg); row.pack(fill="x", padx=8, pady=1)
-            tk.Label(row, text=key, font=("Consolas", fs-2), bg=bg, fg=ORANGE, width=30, anchor="w").pack(side="left", padx=4)
-            tk.Label(row, text=val[:100].replace("\n", " \u21b5 "), font=("Segoe UI", fs-1),
-                     bg=bg, fg=FG, anchor="w").pack(side="left", fill="x", expand=True)
-        if len(items) > 200:
-            tk.Label(frame, text=f"... +{len(items)-200} more", font=("Segoe UI", fs-1), bg=BG, fg=FG_DIM).pack(pady=8)
+        txt = self._text_pane()
+        txt.tag_configure("key", foreground=ORANGE, font=("Consolas", fs-2))
+        insert = txt.insert
+        for key, val in items:
+            insert("end", f"{key:<32}", ("key",))
+            insert("end", "  " + val[:100].replace("\n", " \u21b5 ") + "\n")
+        txt.configure(state="disabled")
 
     def _show_dialog_group(self, items):
         self._clear(); fs = self.font_size
         if not items: return
-        m = re.match(r"^DQ_(\d+)", items[0][0])
+        m = _DQ_MATCH(items[0][0])
         qid = f"Q_{m.group(1)}" if m else "?"
         qname = self.translations.get(qid, "")
-        hdr = tk.Frame(self.detail, bg=BG3, padx=12, pady=8); hdr.pack(fill="x")
+        hdr = tk.Frame(self._header_area, bg=BG3, padx=12, pady=8); hdr.pack(fill="x")
         tk.Label(hdr, text=f"\U0001f4ac  {qid}: {qname}" if qname else f"\U0001f4ac  {qid}",
                  font=("Segoe UI", fs+1, "bold"), bg=BG3, fg=CYAN).pack(anchor="w")
         tk.Label(hdr, text=f"{len(items)} text entries", font=("Segoe UI", fs-1), bg=BG3, fg=FG_DIM).pack(anchor="w")
-        _, frame = self._scrollable()
+        txt = self._text_pane(wrap="word")
+        txt.tag_configure("meta_npc", foreground=FG_DIM, font=("Consolas", fs-3),
+                          rmargin=80, spacing1=6)
+        txt.tag_configure("meta_hero", foreground=FG_DIM, font=("Consolas", fs-3),
+                          lmargin1=80, lmargin2=80, spacing1=6)
+        txt.tag_configure("npc", foreground=FG, font=("Segoe UI", fs), rmargin=80)
+        txt.tag_configure("hero", foreground=GREEN, font=("Segoe UI", fs),
+                          lmargin1=80, lmargin2=80)
+        insert = txt.insert
         for key, val in items:
             sp = key.split(".", 1)[1] if "." in key else ""
-            is_hero = any(s in sp for s in ["CLOSE", "QC", "QNS", "QS"])
-            bgc = "#1a3a1a" if is_hero else BG3
-            fgc = GREEN if is_hero else FG
+            is_hero = _HERO_SUFFIX(sp) is not None
             speaker = "Hero" if is_hero else "NPC"
-            padl, padr = (80, 12) if is_hero else (12, 80)
-            bubble = tk.Frame(frame, bg=bgc, padx=10, pady=6)
-            bubble.pack(fill="x", padx=(padl, padr), pady=2)
-            tk.Label(bubble, text=f"{speaker}  \u2022  {key}", font=("Consolas", fs-3), bg=bgc, fg=FG_DIM).pack(anchor="w")
-            tk.Label(bubble, text=val, font=("Segoe UI", fs), bg=bgc, fg=fgc,
-                     wraplength=600, justify="left", anchor="w").pack(anchor="w", pady=(2, 0))
+            insert("end", f"{speaker}  \u2022  {key}\n",
+                   ("meta_hero" if is_hero else "meta_npc",))
+            insert("end", f"{val}\n", ("hero" if is_hero else "npc",))
+        txt.configure(state="disabled")
 
     def _show_quest_group(self, items):
         self._clear(); fs = self.font_size
@@ -485,16 +802,16 @@ class App:
         qname = ""
         for k, v in items:
             if "_" not in k[2:]: qname = v; break
-        m = re.match(r"^Q_(\d+)", items[0][0])
+        m = _Q_MATCH(items[0][0])
         qid = f"Q_{m.group(1)}" if m else "?"
-        hdr = tk.Frame(self.detail, bg=BG3, padx=12, pady=8); hdr.pack(fill="x")
+        hdr = tk.Frame(self._header_area, bg=BG3, padx=12, pady=8); hdr.pack(fill="x")
         tk.Label(hdr, text=f"\U0001f4dc  {qid}: {qname}" if qname else f"\U0001f4dc  {qid}",
                  font=("Segoe UI", fs+1, "bold"), bg=BG3, fg=GREEN).pack(anchor="w")
         _, frame = self._scrollable()
         sfx = {"": "Quest Name", "QTD": "Description (Take)", "QSD": "Description (Solve)", "QCD": "Description (Close)"}
         for key, val in items:
             s = key.split("_", 2)[-1] if "_" in key[2:] else ""
-            s = re.sub(r"^\d+_?", "", s) or ""
+            s = _NUMPFX_SUB("", s) or ""
             label = sfx.get(s, s or "Name")
             row = tk.Frame(frame, bg=BG2, padx=10, pady=6); row.pack(fill="x", padx=12, pady=3)
             tk.Label(row, text=label, font=("Segoe UI", fs-1, "bold"), bg=BG2, fg=ORANGE).pack(anchor="w")
@@ -503,7 +820,7 @@ class App:
 
     def _show_entry(self, key, val):
         self._clear(); fs = self.font_size
-        hdr = tk.Frame(self.detail, bg=BG3, padx=12, pady=8); hdr.pack(fill="x")
+        hdr = tk.Frame(self._header_area, bg=BG3, padx=12, pady=8); hdr.pack(fill="x")
         tk.Label(hdr, text=key, font=("Consolas", fs, "bold"), bg=BG3, fg=ORANGE).pack(anchor="w")
         _, frame = self._scrollable()
         tf = tk.Frame(frame, bg=BG2, padx=12, pady=10); tf.pack(fill="x", padx=12, pady=(12, 4))
@@ -517,13 +834,14 @@ class App:
                 tk.Label(af, text=f"\U0001f517  Alias: {akey} \u2192 {aval}",
                          font=("Consolas", fs-2), bg=BG3, fg=BLUE).pack(anchor="w")
         if self.compare_translations:
-            cv = self.compare_translations.get(key)
+            verdict = self._diff.get(key)
             cf = tk.Frame(frame, bg=BG3, padx=12, pady=10); cf.pack(fill="x", padx=12, pady=4)
-            if cv is None:
+            if verdict is None:
                 tk.Label(cf, text="\u274c  Not in comparison", font=("Segoe UI", fs-1), bg=BG3, fg=RED).pack(anchor="w")
-            elif cv == val:
+            elif verdict == 0:
                 tk.Label(cf, text="\u2705  Identical", font=("Segoe UI", fs-1), bg=BG3, fg=GREEN).pack(anchor="w")
             else:
+                cv = self.compare_translations.get(key)
                 tk.Label(cf, text="\U0001f504  Different:", font=("Segoe UI", fs-1, "bold"), bg=BG3, fg=YELLOW).pack(anchor="w")
                 ct = tk.Text(cf, font=("Segoe UI", fs), bg=BG3, fg=YELLOW, wrap="word",
                              height=max(2, cv.count("\n")+2), bd=0, highlightthickness=0)
@@ -533,7 +851,7 @@ class App:
 
     def _show_alias(self, akey, aval):
         self._clear(); fs = self.font_size
-        hdr = tk.Frame(self.detail, bg=BG3, padx=12, pady=8); hdr.pack(fill="x")
+        hdr = tk.Frame(self._header_area, bg=BG3, padx=12, pady=8); hdr.pack(fill="x")
         tk.Label(hdr, text="\U0001f517  Alias", font=("Segoe UI", fs+1, "bold"), bg=BG3, fg=BLUE).pack(anchor="w")
         _, frame = self._scrollable()
         for label, k, color in [("From:", akey, ORANGE), ("To:", aval, GREEN)]:
@@ -548,84 +866,111 @@ class App:
 
     def _show_aliases_overview(self):
         self._clear(); fs = self.font_size
-        hdr = tk.Frame(self.detail, bg=BG3, padx=12, pady=8); hdr.pack(fill="x")
+        hdr = tk.Frame(self._header_area, bg=BG3, padx=12, pady=8); hdr.pack(fill="x")
         tk.Label(hdr, text=f"\U0001f517  Aliases ({len(self.aliases)})",
                  font=("Segoe UI", fs+2, "bold"), bg=BG3, fg=BLUE).pack(anchor="w")
         tk.Label(hdr, text="Dialog text reuse \u2014 same line in different quest states",
                  font=("Segoe UI", fs-1), bg=BG3, fg=FG_DIM).pack(anchor="w")
-        _, frame = self._scrollable()
-        for i, (akey, aval) in enumerate(self.aliases.items()):
-            bg = BG2 if i % 2 == 0 else BG
-            row = tk.Frame(frame, bg=bg); row.pack(fill="x", padx=8, pady=1)
-            tk.Label(row, text=akey, font=("Consolas", fs-2), bg=bg, fg=ORANGE, anchor="w").pack(side="left", padx=4)
-            tk.Label(row, text="\u2192", font=("Segoe UI", fs-1), bg=bg, fg=BLUE).pack(side="left", padx=4)
-            tk.Label(row, text=aval, font=("Consolas", fs-2), bg=bg, fg=GREEN, anchor="w").pack(side="left", padx=4)
+        txt = self._text_pane()
+        txt.tag_configure("akey", foreground=ORANGE, font=("Consolas", fs-2))
+        txt.tag_configure("arrow", foreground=BLUE)
+        txt.tag_configure("aval", foreground=GREEN, font=("Consolas", fs-2))
+        insert = txt.insert
+        for akey, aval in self.aliases.items():
+            insert("end", akey, ("akey",))
+            insert("end", "  \u2192  ", ("arrow",))
+            insert("end", aval + "\n", ("aval",))
+        txt.configure(state="disabled")
 
     def _show_quest_trees_overview(self):
         self._clear(); fs = self.font_size
-        td = sum(len(d) for d in self.quests.values())
-        hdr = tk.Frame(self.detail, bg=BG3, padx=12, pady=8); hdr.pack(fill="x")
+        td = self._stats[0]
+        hdr = tk.Frame(self._header_area, bg=BG3, padx=12, pady=8); hdr.pack(fill="x")
         tk.Label(hdr, text="\U0001f3ad  Dialog Trees", font=("Segoe UI", fs+2, "bold"), bg=BG3, fg=PINK).pack(anchor="w")
         tk.Label(hdr, text=f"{len(self.quests)} quests with {td:,} dialog nodes",
                  font=("Segoe UI", fs-1), bg=BG3, fg=FG_DIM).pack(anchor="w")
         tk.Label(hdr, text="Speakers, sound cues, branching, cameras, animations",
                  font=("Segoe UI", fs-2), bg=BG3, fg=CYAN).pack(anchor="w")
         _, frame = self._scrollable()
-        sq = sorted(self.quests.items(), key=lambda x: len(x[1]), reverse=True)
+        sq = heapq.nlargest(30, self.quests.items(), key=lambda x: len(x[1]))
         tk.Label(frame, text="Top 30 by dialog count:", font=("Segoe UI", fs, "bold"),
                  bg=BG, fg=FG).pack(anchor="w", padx=16, pady=(12, 4))
         mx = len(sq[0][1]) if sq else 1
-        for qid, dlgs in sq[:30]:
-            qname = self.translations.get(qid.replace("DQ_", "Q_"), "")
-            row = tk.Frame(frame, bg=BG); row.pack(fill="x", padx=16, pady=1)
-            tk.Label(row, text=qid, font=("Consolas", fs-2), bg=BG, fg=ORANGE, width=12, anchor="e").pack(side="left")
+        top = sq
+        rowh = 20
+        bars = tk.Canvas(frame, bg=BG, highlightthickness=0, width=680,
+                         height=rowh * len(top))
+        bars.pack(anchor="w", padx=16, pady=1)
+        y = 0
+        for qid, dlgs in top:
+            qname = self._quest_name_cache.get(qid, "")
+            cy = y + rowh // 2
+            bars.create_text(110, cy, text=qid, anchor="e", fill=ORANGE,
+                             font=("Consolas", fs-2))
             bw = max(4, int(250 * len(dlgs) / mx))
-            bar = tk.Frame(row, bg=CYAN, height=16, width=bw)
-            bar.pack(side="left", padx=(8, 4)); bar.pack_propagate(False)
-            tk.Label(row, text=str(len(dlgs)), font=("Segoe UI", fs-2, "bold"), bg=BG, fg=CYAN).pack(side="left", padx=(0, 8))
+            bars.create_rectangle(118, y+2, 118+bw, y+rowh-2, fill=CYAN, outline="")
+            x = 124 + bw
+            bars.create_text(x, cy, text=str(len(dlgs)), anchor="w", fill=CYAN,
+                             font=("Segoe UI", fs-2, "bold"))
             if qname:
-                tk.Label(row, text=qname[:40], font=("Segoe UI", fs-2), bg=BG, fg=FG_DIM).pack(side="left")
+                bars.create_text(x + 40, cy, text=qname[:40], anchor="w",
+                                 fill=FG_DIM, font=("Segoe UI", fs-2))
+            y += rowh
 
     def _show_quest_tree(self, qid, dialogs):
         self._clear(); fs = self.font_size
-        qname = self.translations.get(qid.replace("DQ_", "Q_"), "")
-        hdr = tk.Frame(self.detail, bg=BG3, padx=12, pady=8); hdr.pack(fill="x")
-        title = f"\U0001f3ad  {qid}: {qname}" if qname else f"\U0001f3ad  {qid}"
+        hdr = tk.Frame(self._header_area, bg=BG3, padx=12, pady=8); hdr.pack(fill="x")
+        title = "\U0001f3ad  " + self._quest_label_cache.get(qid, qid)
         tk.Label(hdr, text=title, font=("Segoe UI", fs+1, "bold"), bg=BG3, fg=PINK).pack(anchor="w")
-        lectors = set(d["lector"] for d in dialogs)
-        cues = sum(1 for d in dialogs if d["sound_cue"])
+        lectors = set(d.lector for d in dialogs)
+        cues = sum(1 for d in dialogs if d.sound_cue)
         tk.Label(hdr, text=f"{len(dialogs)} nodes  |  {len(lectors)} speakers  |  {cues} sound cues",
                  font=("Segoe UI", fs-1), bg=BG3, fg=FG_DIM).pack(anchor="w")
         _, frame = self._scrollable()
+        body = self._quest_tree_frames.get(qid)
+        if body is not None:
+            # Rebuilt view served from cache: bump LRU order and repack.
+            self._quest_tree_frames[qid] = self._quest_tree_frames.pop(qid)
+            body.pack(fill="both", expand=True)
+            return
+        body = tk.Frame(frame, bg=BG)
+        body.pack(fill="both", expand=True)
+        # One font spec per role, hoisted out of the per-node loop; Tk
+        # reparses the tuple on every widget otherwise.
+        font_meta = ("Consolas", fs-3); font_text = ("Segoe UI", fs)
         for i, d in enumerate(dialogs):
-            text = self.translations.get(d["trans_id"], "")
-            is_hero = d["lector"] == 1
+            text = self.translations.get(d.trans_id, "")
+            is_hero = d.lector == 1
             bgc = "#1a3a1a" if is_hero else BG3
             fgc = GREEN if is_hero else FG
-            speaker = "Hero" if is_hero else f"Lector #{d['lector']}"
+            speaker = "Hero" if is_hero else f"Lector #{d.lector}"
             padl, padr = (80, 12) if is_hero else (12, 80)
-            bubble = tk.Frame(frame, bg=bgc, padx=10, pady=6)
+            bubble = tk.Frame(body, bg=bgc, padx=10, pady=6)
             bubble.pack(fill="x", padx=(padl, padr), pady=2)
             meta = [f"[{i}] {speaker}"]
-            if d["sound_cue"]: meta.append(f"\U0001f50a {d['sound_cue']}")
-            tk.Label(bubble, text="  ".join(meta), font=("Consolas", fs-3), bg=bgc, fg=FG_DIM).pack(anchor="w")
-            display = text if text else f"[{d['trans_id']}]"
-            tk.Label(bubble, text=display, font=("Segoe UI", fs), bg=bgc, fg=fgc,
+            if d.sound_cue: meta.append(f"\U0001f50a {d.sound_cue}")
+            tk.Label(bubble, text="  ".join(meta), font=font_meta, bg=bgc, fg=FG_DIM).pack(anchor="w")
+            display = text if text else f"[{d.trans_id}]"
+            tk.Label(bubble, text=display, font=font_text, bg=bgc, fg=fgc,
                      wraplength=600, justify="left", anchor="w").pack(anchor="w", pady=(2, 0))
             m2 = []
-            if d["next"]: m2.append(f"Next: {d['next']}")
-            if d["flags"]: m2.append(f"Flags: 0x{d['flags']:04x}")
-            if d["cam_angles"]: m2.append(f"Cam: {d['cam_angles']}")
-            if d["anim1"]: m2.append(f"Anim: {d['anim1']}")
+            if d.next: m2.append(f"Next: {list(d.next)}")
+            if d.flags: m2.append(f"Flags: 0x{d.flags:04x}")
+            if d.cam_angles: m2.append(f"Cam: {list(d.cam_angles)}")
+            if d.anim1: m2.append(f"Anim: {d.anim1}")
             if m2:
-                tk.Label(bubble, text="  |  ".join(m2), font=("Consolas", fs-3), bg=bgc, fg=FG_DIM).pack(anchor="w", pady=(2, 0))
+                tk.Label(bubble, text="  |  ".join(m2), font=font_meta, bg=bgc, fg=FG_DIM).pack(anchor="w", pady=(2, 0))
+        self._quest_tree_frames[qid] = body
+        if len(self._quest_tree_frames) > 8:
+            evicted = next(iter(self._quest_tree_frames))
+            self._quest_tree_frames.pop(evicted).destroy()
 
     def _show_dialog_node(self, qid, idx, d):
         self._clear(); fs = self.font_size
-        text = self.translations.get(d["trans_id"], "(no text)")
-        is_hero = d["lector"] == 1
-        hdr = tk.Frame(self.detail, bg=BG3, padx=12, pady=8); hdr.pack(fill="x")
-        speaker = "Hero" if is_hero else f"Lector #{d['lector']}"
+        text = self.translations.get(d.trans_id, "(no text)")
+        is_hero = d.lector == 1
+        hdr = tk.Frame(self._header_area, bg=BG3, padx=12, pady=8); hdr.pack(fill="x")
+        speaker = "Hero" if is_hero else f"Lector #{d.lector}"
         tk.Label(hdr, text=f"\U0001f399  Dialog Node [{idx}]  \u2014  {speaker}",
                  font=("Segoe UI", fs+1, "bold"), bg=BG3, fg=GREEN if is_hero else FG).pack(anchor="w")
         tk.Label(hdr, text=f"Quest: {qid}", font=("Segoe UI", fs-1), bg=BG3, fg=FG_DIM).pack(anchor="w")
@@ -635,55 +980,159 @@ class App:
         tk.Label(tf, text=text, font=("Segoe UI", fs+1), bg=tf.cget("bg"),
                  fg=GREEN if is_hero else FG, wraplength=650, justify="left", anchor="w").pack(anchor="w")
         props = [
-            ("Translation ID", d["trans_id"], ORANGE),
-            ("Sound Cue", d["sound_cue"] or "(none)", CYAN if d["sound_cue"] else FG_DIM),
-            ("Lector/Speaker", f"{d['lector']}  {'(Hero)' if is_hero else ''}", FG),
-            ("Next Dialogs", str(d["next"]) if d["next"] else "(end)", BLUE),
-            ("Flags", f"0x{d['flags']:08x}", FG),
-            ("Camera Angles", str(d["cam_angles"]) if d["cam_angles"] else "(default)", FG),
-            ("Animation 1", str(d["anim1"]), FG),
-            ("Animation 2", str(d["anim2"]), FG),
+            ("Translation ID", d.trans_id, ORANGE),
+            ("Sound Cue", d.sound_cue or "(none)", CYAN if d.sound_cue else FG_DIM),
+            ("Lector/Speaker", f"{d.lector}  {'(Hero)' if is_hero else ''}", FG),
+            ("Next Dialogs", str(list(d.next)) if d.next else "(end)", BLUE),
+            ("Flags", f"0x{d.flags:08x}", FG),
+            ("Camera Angles", str(list(d.cam_angles)) if d.cam_angles else "(default)", FG),
+            ("Animation 1", str(d.anim1), FG),
+            ("Animation 2", str(d.anim2), FG),
         ]
         for label, val, color in props:
             row = tk.Frame(frame, bg=BG); row.pack(fill="x", padx=16, pady=2)
             tk.Label(row, text=f"{label}:", font=("Segoe UI", fs-1), bg=BG, fg=FG_DIM, width=18, anchor="e").pack(side="left")
             tk.Label(row, text=val, font=("Consolas", fs-1), bg=BG, fg=color).pack(side="left", padx=8)
-        if d["next"]:
+        if d.next:
             tk.Frame(frame, bg=FG_DIM, height=1).pack(fill="x", padx=16, pady=8)
             tk.Label(frame, text="Linked dialog(s):", font=("Segoe UI", fs-1, "bold"), bg=BG, fg=BLUE).pack(anchor="w", padx=16)
             dialogs = self.quests.get(qid, [])
-            for ni in d["next"]:
+            for ni in d.next:
                 if 0 <= ni < len(dialogs):
                     nd = dialogs[ni]
-                    nt = self.translations.get(nd["trans_id"], "")
-                    ns = "Hero" if nd["lector"] == 1 else f"Lector #{nd['lector']}"
-                    preview = nt[:80].replace("\n", " ") if nt else f"[{nd['trans_id']}]"
+                    nt = self.translations.get(nd.trans_id, "")
+                    ns = "Hero" if nd.lector == 1 else f"Lector #{nd.lector}"
+                    preview = nt[:80].translate(_PREVIEW_TBL) if nt else f"[{nd.trans_id}]"
                     nf = tk.Frame(frame, bg=BG2, padx=10, pady=4); nf.pack(fill="x", padx=20, pady=2)
                     tk.Label(nf, text=f"\u2192 [{ni}] {ns}: {preview}",
                              font=("Segoe UI", fs-1), bg=BG2, fg=CYAN).pack(anchor="w")
 
     # ---- SEARCH ----
+    def _queue_search(self, event=None):
+        # Debounce live typing: one scan per pause, not one per keystroke.
+        if event is not None and event.keysym == "Return": return
+        if self._search_after is not None:
+            self.root.after_cancel(self._search_after)
+        self._search_after = self.root.after(250, self._search_now)
+
+    def _search_now(self):
+        if self._search_after is not None:
+            self.root.after_cancel(self._search_after)
+            self._search_after = None
+        self._search()
+
+    _GRAM = 3  # substring index granularity
+
+    def _ensure_search_index(self):
+        # Built on the first query, not at load, so plain browsing never pays
+        # for it (and never forces the lazy values to decode). The index maps
+        # every 3-gram of the lowercased haystacks to the rows containing it:
+        # a row matching any query must contain all of the query's 3-grams,
+        # so candidate verification is exact — no substring can slip through.
+        if self._search_rows is not None: return
+        K = self._GRAM
+        rows = []; grams = {}
+        for key, val in self.translations.items():
+            kl = key.lower(); vl = val.lower()
+            i = len(rows)
+            rows.append((key, val, kl, vl))
+            seen = {kl[j:j+K] for j in range(len(kl) - K + 1)}
+            seen.update(vl[j:j+K] for j in range(len(vl) - K + 1))
+            for g in seen:
+                grams.setdefault(g, []).append(i)
+        self._search_rows = rows; self._search_tokens = grams
+
+    def _candidate_rows(self, terms):
+        # Intersect the 3-gram postings of every term, smallest list first.
+        # None means "scan everything" (no term long enough for a gram); an
+        # empty list means the query provably matches nothing.
+        K = self._GRAM
+        grams = self._search_tokens
+        postings = []
+        for t in terms:
+            for j in range(len(t) - K + 1):
+                p = grams.get(t[j:j+K])
+                if p is None:
+                    return []
+                postings.append(p)
+        if not postings:
+            return None
+        postings.sort(key=len)
+        cand = set(postings[0])
+        for p in postings[1:]:
+            cand.intersection_update(p)
+        return sorted(cand)
+
     def _search(self):
         q = self.search_var.get().strip().lower()
         if not q or len(q) < 2: self.search_lbl.config(text=""); return
-        hits = []
-        for key, val in self.translations.items():
-            if q in key.lower() or q in val.lower():
-                hits.append((key, val))
-            if len(hits) >= 200: break
+        if q == self._last_query and self._results_live:
+            # Same query with its results already on screen (arrow keys,
+            # modifiers, cursor moves): don't rebuild and yank the scroll.
+            return
+        hits = self._search_cache.get(q)
+        if hits is None:
+            self._ensure_search_index()
+            # A spaced query is a set of keywords that must all appear
+            # (anywhere in the key or text); a single word stays a plain
+            # substring match.
+            terms = q.split()
+            if len(terms) == 1:
+                match = lambda r, t=terms[0]: t in r[2] or t in r[3]
+            else:
+                match = lambda r: all(t in r[2] or t in r[3] for t in terms)
+            if (self._last_query and q.startswith(self._last_query)
+                    and not self._last_truncated):
+                # Typing continued: the new hits are a subset of the complete
+                # previous result set, so only refilter those rows.
+                hits = [r for r in self._last_hits if match(r)]
+            else:
+                rows = self._search_rows
+                cand = self._candidate_rows(terms)
+                hits = []
+                for i in (cand if cand is not None else range(len(rows))):
+                    r = rows[i]
+                    if match(r):
+                        hits.append(r)
+                        if len(hits) >= 200: break
+            self._search_cache[q] = hits
+        self._last_query = q; self._last_hits = hits
+        self._last_truncated = len(hits) >= 200
         self.search_lbl.config(text=f"{len(hits)} found")
         if not hits: return
         self._clear(); fs = self.font_size
-        hdr = tk.Frame(self.detail, bg=BG3, padx=12, pady=8); hdr.pack(fill="x")
+        hdr = tk.Frame(self._header_area, bg=BG3, padx=12, pady=8); hdr.pack(fill="x")
         tk.Label(hdr, text=f"\U0001f50d  \"{q}\"", font=("Segoe UI", fs+1, "bold"), bg=BG3, fg=FG).pack(anchor="w")
         tk.Label(hdr, text=f"{len(hits)} results", font=("Segoe UI", fs-1), bg=BG3, fg=FG_DIM).pack(anchor="w")
-        _, frame = self._scrollable()
-        for i, (key, val) in enumerate(hits[:200]):
-            bg = BG2 if i % 2 == 0 else BG
-            row = tk.Frame(frame, bg=bg, padx=10, pady=4); row.pack(fill="x", padx=4, pady=1)
-            tk.Label(row, text=key, font=("Consolas", fs-2), bg=bg, fg=ORANGE).pack(anchor="w")
-            tk.Label(row, text=val[:200].replace("\n", " \u21b5 "), font=("Segoe UI", fs-1), bg=bg, fg=FG,
-                     wraplength=700, justify="left", anchor="w").pack(anchor="w")
+        self._scrollable()
+        shown = hits[:200]
+        pool = self._ensure_result_pool(len(shown))
+        self._results_frame.pack(fill="both", expand=True)
+        f_key = ("Consolas", fs-2); f_val = ("Segoe UI", fs-1)
+        for i, (key, val, _, _) in enumerate(shown):
+            row, kl, vl = pool[i]
+            kl.config(text=key, font=f_key)
+            vl.config(text=val[:200].replace("\n", " \u21b5 "), font=f_val)
+            row.pack(fill="x", padx=4, pady=1)
+        for row, _, _ in pool[len(shown):]:
+            row.pack_forget()
+        self._results_live = True
+
+    def _ensure_result_pool(self, n):
+        # Result rows are mutated and re-shown, never rebuilt: 200 widget
+        # configs per query instead of 600 widget creations.
+        if self._results_frame is None:
+            self._results_frame = tk.Frame(self._scroll_frame, bg=BG)
+        pool = self._result_pool
+        while len(pool) < n:
+            bg = BG2 if len(pool) % 2 == 0 else BG
+            row = tk.Frame(self._results_frame, bg=bg, padx=10, pady=4)
+            kl = tk.Label(row, bg=bg, fg=ORANGE, anchor="w")
+            vl = tk.Label(row, bg=bg, fg=FG, wraplength=700,
+                          justify="left", anchor="w")
+            kl.pack(anchor="w"); vl.pack(anchor="w")
+            pool.append((row, kl, vl))
+        return pool
 
 if __name__ == "__main__":
     App()
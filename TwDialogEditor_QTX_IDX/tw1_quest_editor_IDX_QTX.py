@@ -10,9 +10,18 @@ WhizzEdit still needed for compiling QTX/LAN.
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import os, re, shutil, struct
-import xml.etree.ElementTree as ET
-from collections import OrderedDict
+from tkinter import font as tkfont
+import io, os, re, shutil, struct, sys
+from functools import lru_cache
+import bisect, weakref
+try:
+    # Optional accelerator: lxml parses and serialises IDX files about twice
+    # as fast as stdlib ElementTree. Same API surface for what we use.
+    from lxml import etree as ET
+    HAVE_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAVE_LXML = False
 
 VERSION = "1.2"
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -63,43 +72,165 @@ ICONS = {
 }
 
 NS_XSI = "http://www.w3.org/2001/XMLSchema-instance"
-HIDDEN_FIELDS = {"nodes"}
+_WORD_CHARS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_")
+
+def _parse_cs(cs):
+    """One-pass find/slice scanner for "Model(Level)#Equip(p)Equip(p)...".
+
+    Same results as the regexes it replaces, without engine dispatch or
+    MatchObject churn on the selection-render path.
+    """
+    model, _, equip = cs.partition("#")
+    name = model; level = None
+    i = model.find("(")
+    if i > 0:
+        j = model.find(")", i + 1)
+        if j > i + 1 and set(model[:i]) <= _WORD_CHARS and model[i+1:j].isdigit():
+            name, level = model[:i], model[i+1:j]
+    equips = []
+    pos = 0; find = equip.find
+    while True:
+        i = find("(", pos)
+        if i < 0: break
+        j = find(")", i + 1)
+        if j < 0: break
+        k = i
+        while k > pos and equip[k-1] in _WORD_CHARS: k -= 1
+        if k < i and j > i + 1:
+            equips.append((equip[k:i], equip[i+1:j]))
+            pos = j + 1
+        else:
+            pos = i + 1
+    return name, level, equips
+HIDDEN_FIELDS = frozenset({"nodes"})
+QTX_SUB_NODE_TYPES = frozenset({"QTX_ACTION", "QTX_FC", "QTX_AOQ",
+                                "QTX_REWARD", "QTX_GIVER"})
+HERO_LECTORS = frozenset({"Hero", "HERO"})
+QTX_QUEST_EDITABLE = frozenset({"group", "guild", "min_rep", "add_to_log"})
+# Display order for the IDX detail views; the frozenset twin feeds the
+# ordering set-diff in _show_props.
+CHAR_PRIORITY = ("iid","name","text","marker","sector","angle","party","guild",
+                 "lector","create_string","exp","exp_level","remove_from_map",
+                 "random_stuff","notes","rumors_dialog")
+QUEST_PRIORITY = ("iid","name","text","activation","group","guild",
+                  "min_reputation","add_to_quest_log","can_be_failed",
+                  "quest_state","notes")
+PRIORITY_SETS = {CHAR_PRIORITY: frozenset(CHAR_PRIORITY),
+                 QUEST_PRIORITY: frozenset(QUEST_PRIORITY)}
+EDIT_FIELDS = frozenset({
+    "text","name","notes","create_string","sector","angle",
+    "party","guild","lector","activation","min_reputation",
+    "exp","exp_level","random_stuff","remove_from_map",
+    "can_be_failed","add_to_quest_log","quest_state","marker","rumors_dialog"})
+# node_type -> _stats counter; Dialog-ish types are a substring test instead
+_STAT_BUCKET = {"NodeQuest": "q", "QTX_QUEST": "q", "SHF_QUEST": "q",
+                "NodeCharacter": "c", "QTX_NPC": "c", "NodeEnemy": "e"}
 
 # ============================================================
 # GENERIC NODE
 # ============================================================
+def _node_display(node):
+    # Tree-row label "<icon>  <text>", cached on the node so collapse/expand
+    # cycles don't redo the icon lookup, slicing and formatting. The edit
+    # handlers drop the cache when the underlying text changes.
+    t = node.node_type
+    icon = ICONS.get(t, "\u2022")
+    display = node.name or t
+    if node.is_dialog:
+        txt = node.props.get("text") or ""
+        if txt:
+            display = txt[:55].replace("\n"," ")
+            if len(txt) > 55: display += "..."
+    if t == "QTX_QUEST": display = node.props.get("id", node.name)
+    if t in QTX_SUB_NODE_TYPES:
+        raw = node.props.get("raw", node.name)
+        display = raw[:65]
+        if len(raw) > 65: display += "..."
+    if t == "SHF_DIALOG":
+        txt = node.props.get("text") or ""
+        display = txt[:60].replace("\n"," ").replace("\r","")
+        if len(txt) > 60: display += "..."
+    node._display = f"{icon}  {display}"
+    return node._display
+
+
+_NO_CHILDREN = ()  # shared leaf marker: most nodes never get children
+
 class Node:
     __slots__ = ("node_type", "name", "props", "children", "element",
-                 "line_start", "line_end", "raw_line")
+                 "line_start", "line_end", "raw_line", "is_dialog", "_hay",
+                 "_display", "_child_by_tag", "__weakref__")
+
+    # props that take part in search, in the order they are joined
+    _HAY_KEYS = ("id", "iid", "text", "notes", "create_string", "raw",
+                 "action_type", "fc_type", "npc", "target", "object_items")
+
     def __init__(self, node_type, name="", props=None, children=None,
                  element=None, line_start=-1, line_end=-1, raw_line=""):
-        self.node_type = node_type
+        # Types come from a small fixed vocabulary: intern for pointer
+        # compares and precompute the dialog-text test walks keep asking.
+        self.node_type = sys.intern(node_type)
+        self.is_dialog = "DialogText" in node_type
         self.name = name
-        self.props = props or OrderedDict()
-        self.children = children or []
+        self.props = props if props is not None else {}
+        self.children = children if children is not None else _NO_CHILDREN
         self.element = element
         self.line_start = line_start
         self.line_end = line_end
         self.raw_line = raw_line
+        self._hay = None
+        self._display = None
+        self._child_by_tag = None
+
+    def search_hay(self):
+        # The lowercased haystack is built once per node and dropped by the
+        # edit handlers; each search keystroke then runs only C-level "in".
+        h = self._hay
+        if h is None:
+            props_get = self.props.get
+            parts = [self.name] if self.name else []
+            for k in self._HAY_KEYS:
+                v = props_get(k)
+                if v: parts.append(v)
+            h = self._hay = " ".join(parts).lower()
+        return h
+
+    def add(self, child):
+        # Leaves share the empty tuple; the list exists only once needed.
+        if self.children is _NO_CHILDREN:
+            self.children = []
+        self.children.append(child)
 
 
 # ============================================================
 # IDX PARSER (SOAP-XML)
 # ============================================================
+@lru_cache(maxsize=512)
 def _strip(tag):
-    return tag.split("}", 1)[1] if "}" in tag else tag
+    # Tags come from a small fixed vocabulary but arrive namespace-qualified
+    # for every element; the C-level lru_cache makes repeats one hash probe.
+    # lxml hands comments/PIs a non-string tag — treat those as nameless.
+    if not isinstance(tag, str): return ""
+    # Interned so props keyed by stripped tags hit the dict's
+    # pointer-equality fast path in the per-keystroke lookups.
+    return sys.intern(tag.split("}", 1)[1] if "}" in tag else tag)
 
 def parse_idx(filepath):
+    # Full DOM parse is kept (save re-serialises self.xml_tree, so the tree
+    # must stay in memory); the id index and the RootNode are collected in
+    # one walk over Body instead of two.
     tree = ET.parse(filepath)
     root = tree.getroot()
     body = None
     for e in root:
         if _strip(e.tag) == "Body": body = e; break
     if body is None: raise ValueError("No SOAP-ENV:Body")
-    ref_idx = {}
+    ref_idx = {}; root_el = None
     for e in body:
-        eid = e.get("id", "")
+        eid = e.get("id")
         if eid: ref_idx[eid] = e
+        if root_el is None and _strip(e.tag) == "RootNode": root_el = e
     def resolve(href):
         if href and href.startswith("#"): return ref_idx.get(href[1:])
     def parse_el(elem):
@@ -112,7 +243,7 @@ def parse_idx(filepath):
                     cn = parse_el(ce)
                     if cn is not None: ch.append(cn)
             return ch
-        props = OrderedDict(); name = ""; child_arr = None
+        props = {}; name = ""; child_arr = None
         for child in elem:
             ct = _strip(child.tag)
             if child.get(f"{{{NS_XSI}}}null", "") == "1": props[ct] = None
@@ -122,12 +253,9 @@ def parse_idx(filepath):
                 ae = resolve(child.get("href", ""))
                 if ae is not None: child_arr = parse_el(ae)
             else: props[ct] = (child.text or "").strip()
-        children = child_arr if isinstance(child_arr, list) else []
+        children = child_arr if isinstance(child_arr, list) else None
         return Node(tag, name=name or props.get("iid","") or props.get("text","") or tag,
             props=props, children=children, element=elem)
-    root_el = None
-    for e in body:
-        if _strip(e.tag) == "RootNode": root_el = e; break
     if root_el is None: raise ValueError("No RootNode")
     return parse_el(root_el), tree
 
@@ -145,7 +273,7 @@ def _null(v): return None if v == "(null)" else v
 def _parse_qtx_npc(lines, i):
     line = lines[i].strip()
     parts = line.split(" ", 12)
-    props = OrderedDict()
+    props = {}
     for j, f in enumerate(NPC_FIELDS):
         if j+1 < len(parts): props[f] = _null(parts[j+1])
     node = Node("QTX_NPC", name=props.get("id",""), props=props, line_start=i, raw_line=line)
@@ -162,47 +290,62 @@ def _parse_qtx_npc(lines, i):
         else: i += 1
     return node, i
 
-def _parse_qtx_location(lines, i):
+def _parse_qtx_location(lines, i, bounds=None):
     line = lines[i].strip()
     parts = line.split(" ")
-    props = OrderedDict()
+    props = {}
     for j, f in enumerate(LOC_FIELDS):
         if j+1 < len(parts): props[f] = _null(parts[j+1])
     node = Node("QTX_LOCATION", name=props.get("id",""), props=props, line_start=i, raw_line=line)
+    if bounds is not None:
+        # The section ends at the next LOCATION/QUEST header from the
+        # precomputed boundary table — no per-line header probes.
+        j = bisect.bisect_right(bounds, i)
+        stop = bounds[j] if j < len(bounds) else len(lines)
+    else:
+        stop = len(lines)
     i += 1
-    while i < len(lines):
+    while i < stop:
         sl = lines[i]
-        if sl.startswith("LOCATION ") or sl.startswith("QUEST "): break
+        if bounds is None and (sl.startswith("LOCATION ") or sl.startswith("QUEST ")):
+            break
         if sl.strip().startswith("NPC "):
-            sub, i = _parse_qtx_npc(lines, i); node.children.append(sub)
+            sub, i = _parse_qtx_npc(lines, i); node.add(sub)
         else: i += 1
     node.line_end = i - 1
     return node, i
 
+# Field layout per sub-record type: (leading fields, catch-all tail field).
+# A type with a tail requires all leading fields present; GIVER has no tail
+# and fills whatever positions exist.
+_QTX_SUB_SPECS = {
+    "QTX_ACTION": (("action_type", "trigger"), "params"),
+    "QTX_FC":     (("fc_type",), "params"),
+    "QTX_AOQ":    (("aoq_action", "trigger"), "target"),
+    "QTX_REWARD": (("reward_type", "trigger"), "amount"),
+    "QTX_GIVER":  (("status", "npc", "behavior", "on_solve"), None),
+}
+
 def _parse_qtx_sub(line, ntype, li):
-    parts = line.strip().split(" ")
-    params = parts[1:]
-    props = OrderedDict({"raw": line.strip()})
-    if ntype == "QTX_ACTION" and len(params) >= 2:
-        props["action_type"] = params[0]; props["trigger"] = params[1]
-        props["params"] = " ".join(params[2:])
-    elif ntype == "QTX_FC" and len(params) >= 1:
-        props["fc_type"] = params[0]; props["params"] = " ".join(params[1:])
-    elif ntype == "QTX_AOQ" and len(params) >= 2:
-        props["aoq_action"] = params[0]; props["trigger"] = params[1]
-        props["target"] = " ".join(params[2:])
-    elif ntype == "QTX_REWARD" and len(params) >= 2:
-        props["reward_type"] = params[0]; props["trigger"] = params[1]
-        props["amount"] = " ".join(params[2:])
-    elif ntype == "QTX_GIVER":
-        for k, idx in [("status",0),("npc",1),("behavior",2),("on_solve",3)]:
-            if len(params) > idx: props[k] = params[idx]
-    return Node(ntype, name=line.strip(), props=props, line_start=li, raw_line=line.strip())
+    raw = line.strip()
+    params = raw.split(" ")[1:]
+    props = {"raw": raw}
+    fields, tail = _QTX_SUB_SPECS[ntype]
+    if tail is None or len(params) >= len(fields):
+        for i, name in enumerate(fields):
+            if i >= len(params): break
+            props[name] = params[i]
+        if tail is not None:
+            props[tail] = " ".join(params[len(fields):])
+    return Node(ntype, name=raw, props=props, line_start=li, raw_line=raw)
+
+_QTX_SUB_TYPES = {"ACTION": "QTX_ACTION", "FC": "QTX_FC", "AOQ": "QTX_AOQ",
+                  "REWARD": "QTX_REWARD", "GIVER": "QTX_GIVER"}
 
 def _parse_qtx_quest(lines, i):
     line = lines[i].strip()
     parts = line.split(" ")
-    props = OrderedDict()
+    props = {}
     for j, f in enumerate(QUEST_FIELDS):
         if j+1 < len(parts): props[f] = _null(parts[j+1])
     node = Node("QTX_QUEST", name=props.get("id",""), props=props, line_start=i, raw_line=line)
@@ -211,9 +354,8 @@ def _parse_qtx_quest(lines, i):
         sl = lines[i].strip()
         if sl == "END": node.line_end = i; i += 1; break
         kw = sl.split(" ", 1)[0]
-        type_map = {"ACTION":"QTX_ACTION","FC":"QTX_FC","AOQ":"QTX_AOQ",
-                    "REWARD":"QTX_REWARD","GIVER":"QTX_GIVER"}
-        if kw in type_map: node.children.append(_parse_qtx_sub(sl, type_map[kw], i))
+        ntype = _QTX_SUB_TYPES.get(kw)
+        if ntype: node.add(_parse_qtx_sub(sl, ntype, i))
         i += 1
     return node, i
 
@@ -224,32 +366,41 @@ def parse_qtx(filepath):
     npcs = Node("QTX_FOLDER", name="NPCs")
     locs = Node("QTX_FOLDER", name="Locations")
     quests = Node("QTX_FOLDER", name="Quests")
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        if line.startswith("NPC "):
-            n, i = _parse_qtx_npc(lines, i); npcs.children.append(n)
-        elif line.startswith("LOCATION "):
-            n, i = _parse_qtx_location(lines, i); locs.children.append(n)
-        elif line.startswith("QUEST "):
-            n, i = _parse_qtx_quest(lines, i); quests.children.append(n)
-        else: i += 1
+    # Section-boundary skip table: LOCATION bodies end at the next header,
+    # found by bisect instead of probing every line on the way there.
+    bounds = [j for j, l in enumerate(lines)
+              if l.startswith(("LOCATION ", "QUEST "))]
+    # One token hash per line instead of a startswith cascade; the "sep"
+    # check keeps a bare keyword line (no params) unhandled, as before.
+    handlers = {"NPC": (lambda k: _parse_qtx_npc(lines, k), npcs),
+                "LOCATION": (lambda k: _parse_qtx_location(lines, k, bounds), locs),
+                "QUEST": (lambda k: _parse_qtx_quest(lines, k), quests)}
+    i = 0; n_lines = len(lines)
+    while i < n_lines:
+        tok, sep, _ = lines[i].partition(" ")
+        h = handlers.get(tok) if sep else None
+        if h is None:
+            i += 1
+        else:
+            node, i = h[0](i)
+            h[1].add(node)
     root.children = [npcs, locs, quests]
     return root, lines
 
 def save_qtx(filepath, root_node, original_lines):
     out = []
-    def write_npc(node, indent=""):
+    def write_npc(node):
+        # Every caller writes NPCs at top level; no indent prefix to concat.
         parts = ["NPC"]
         for f in NPC_FIELDS:
             v = node.props.get(f); parts.append(v if v is not None else "(null)")
-        out.append(indent + " ".join(parts))
+        out.append(" ".join(parts))
         obj = node.props.get("objects", "False")
         items = node.props.get("object_items", "")
-        obj_line = indent + "  OBJECTS " + obj
+        obj_line = "  OBJECTS " + obj
         if items: obj_line += " " + items
         out.append(obj_line)
-        out.append(indent + "END")
+        out.append("END")
     def write_location(node):
         parts = ["LOCATION"]
         for f in LOC_FIELDS:
@@ -271,14 +422,28 @@ def save_qtx(filepath, root_node, original_lines):
             for n in folder.children: write_location(n)
         elif folder.name == "Quests":
             for n in folder.children: write_quest(n)
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write("\n".join(out) + "\n")
+    # One join, one encode, one binary write: no per-line text-mode
+    # encoding or newline translation.
+    with open(filepath, "wb") as f:
+        f.write(("\n".join(out) + "\n").encode("utf-8"))
 
 
 # ============================================================
 # SHF PARSER (.NET BinaryFormatter — read-only)
 # ============================================================
+# .shf string categories, compiled once
+_SHF_GROUP = re.compile(r"[A-Z][A-Z_]{2,30}").fullmatch
+_SHF_QID = re.compile(r"Q_\d+").fullmatch
+_SHF_NPC = re.compile(r"NPC_\d+").fullmatch
+_SHF_PUNCT = frozenset(".!?,;:")  # dialog-text marker characters
+
 def _read_7bit(data, pos):
+    # Fast path: lengths under 128 are a single byte, which covers nearly
+    # every string record; skip the shift/accumulate loop entirely.
+    if pos < len(data):
+        b = data[pos]
+        if b < 0x80:
+            return b, pos + 1
     result = 0; shift = 0
     while pos < len(data):
         b = data[pos]; pos += 1
@@ -298,89 +463,95 @@ def parse_shf(filepath):
     with open(filepath, "rb") as f:
         data = f.read()
 
-    # Extract all BinaryObjectString records (type 0x06)
+    # Extract all BinaryObjectString records (type 0x06). find() jumps
+    # between candidate bytes at C speed instead of stepping pos through
+    # every byte in Python.
     strings = {}  # obj_id -> text
+    find = data.find
+    end = len(data) - 6
     pos = 0
-    while pos < len(data) - 6:
-        if data[pos] == 0x06:
-            try:
-                obj_id = struct.unpack_from("<I", data, pos + 1)[0]
-                slen, spos = _read_7bit(data, pos + 5)
-                if 0 < slen < 50000 and spos + slen <= len(data):
-                    text = data[spos:spos+slen].decode("utf-8", errors="replace")
-                    if text and not all(c == "\x00" for c in text):
-                        strings[obj_id] = text
-                        pos = spos + slen; continue
-            except: pass
+    while True:
+        pos = find(b"\x06", pos)
+        if pos < 0 or pos >= end:
+            break
+        try:
+            obj_id = struct.unpack_from("<I", data, pos + 1)[0]
+            slen, spos = _read_7bit(data, pos + 5)
+            if 0 < slen < 50000 and spos + slen <= len(data):
+                text = data[spos:spos+slen].decode("utf-8", errors="replace")
+                if text and not all(c == "\x00" for c in text):
+                    strings[obj_id] = text
+                    pos = spos + slen; continue
+        except: pass
         pos += 1
 
     # Categorize strings
     root = Node("SHF_ROOT", name=os.path.basename(filepath))
     root.props["info"] = "Read-only (.NET BinaryFormatter)"
 
-    # Quest groups (ASHOS, CATHALON etc)
-    groups = sorted(set(v for v in strings.values() if re.match(r"^[A-Z][A-Z_]{2,30}$", v)
-                         and not v.startswith("NPC_") and not v.startswith("Q_")
-                         and not v.startswith("LOC_") and not v.startswith("QITEM_")))
-
-    # Quest IDs
-    quest_ids = sorted(set(v for v in strings.values() if re.match(r"^Q_\d+$", v)),
-                       key=lambda x: int(x.split("_")[1]))
-
-    # NPC references
-    npc_refs = sorted(set(v for v in strings.values() if re.match(r"^NPC_\d+$", v)),
-                      key=lambda x: int(x.split("_")[1]))
-
-    # Dialog texts (long strings with punctuation)
-    dialog_texts = [(k, v) for k, v in sorted(strings.items())
-                    if len(v) > 20 and any(c in v for c in ".!?,;:")
-                    and not v.startswith("WhizzEdit")]
-
-    # Quest items
-    qitems = sorted(set(v for v in strings.values() if v.startswith("QITEM_")))
-
-    # Enemy types
-    enemies = sorted(set(v for v in strings.values() if v.startswith("ENEMY_")))
-
-    # Location refs
-    loc_refs = sorted(set(v for v in strings.values() if v.startswith("LOC_")))
+    # One pass over the extracted strings instead of seven; prefix dispatch
+    # first, at most one (precompiled) regex per item. Group/dialog tests
+    # stay independent of the prefix buckets, matching the old multi-pass
+    # membership (an ENEMY_WOLF is both an enemy type and a group keyword).
+    groups = set(); quest_ids = set(); npc_refs = set()
+    qitems = set(); enemies = set(); loc_refs = set()
+    dialog_texts = []
+    for k, v in sorted(strings.items()):
+        if v.startswith("QITEM_"): qitems.add(v)
+        elif v.startswith("ENEMY_"): enemies.add(v)
+        elif v.startswith("LOC_"): loc_refs.add(v)
+        elif v.startswith("NPC_"):
+            if _SHF_NPC(v): npc_refs.add(v)
+        elif v.startswith("Q_"):
+            if _SHF_QID(v): quest_ids.add(v)
+        if (_SHF_GROUP(v) and not v.startswith(
+                ("NPC_", "Q_", "LOC_", "QITEM_"))):
+            groups.add(v)  # quest groups (ASHOS, CATHALON etc)
+        if (len(v) > 20 and not _SHF_PUNCT.isdisjoint(v)
+                and not v.startswith("WhizzEdit")):
+            dialog_texts.append((k, v))  # long strings with punctuation
+    groups = sorted(groups)
+    quest_ids = sorted(quest_ids, key=lambda x: int(x.split("_")[1]))
+    npc_refs = sorted(npc_refs, key=lambda x: int(x.split("_")[1]))
+    qitems = sorted(qitems); enemies = sorted(enemies)
+    loc_refs = sorted(loc_refs)
 
     # Build tree
     quests_f = Node("SHF_FOLDER", name=f"Quests ({len(quest_ids)})")
     for qid in quest_ids:
-        quests_f.children.append(Node("SHF_QUEST", name=qid,
-            props=OrderedDict({"id": qid})))
+        quests_f.add(Node("SHF_QUEST", name=qid,
+            props={"id": qid}))
 
     npcs_f = Node("SHF_FOLDER", name=f"NPC References ({len(npc_refs)})")
     for npc in npc_refs:
-        npcs_f.children.append(Node("QTX_NPC", name=npc,
-            props=OrderedDict({"id": npc})))
+        npcs_f.add(Node("QTX_NPC", name=npc,
+            props={"id": npc}))
 
     dialogs_f = Node("SHF_FOLDER", name=f"Dialog Texts ({len(dialog_texts)})")
     for obj_id, text in dialog_texts[:500]:  # Limit for performance
         preview = text[:60].replace("\n", " ").replace("\r", "")
-        dialogs_f.children.append(Node("SHF_DIALOG", name=preview,
-            props=OrderedDict({"obj_id": str(obj_id), "text": text})))
+        dialogs_f.add(Node("SHF_DIALOG", name=preview,
+            props={"obj_id": str(obj_id), "text": text}))
 
     groups_f = Node("SHF_FOLDER", name=f"Groups/Keywords ({len(groups)})")
     for g in groups:
-        groups_f.children.append(Node("SHF_GROUP", name=g,
-            props=OrderedDict({"name": g})))
+        groups_f.add(Node("SHF_GROUP", name=g,
+            props={"name": g}))
 
     items_f = Node("SHF_FOLDER", name=f"Quest Items ({len(qitems)})")
     for qi in qitems:
-        items_f.children.append(Node("NodeObject", name=qi,
-            props=OrderedDict({"id": qi})))
+        items_f.add(Node("NodeObject", name=qi,
+            props={"id": qi}))
 
     enemies_f = Node("SHF_FOLDER", name=f"Enemy Types ({len(enemies)})")
     for en in enemies:
-        enemies_f.children.append(Node("NodeEnemy", name=en,
-            props=OrderedDict({"id": en})))
+        enemies_f.add(Node("NodeEnemy", name=en,
+            props={"id": en}))
 
     locs_f = Node("SHF_FOLDER", name=f"Locations ({len(loc_refs)})")
     for loc in loc_refs:
-        locs_f.children.append(Node("QTX_LOCATION", name=loc,
-            props=OrderedDict({"id": loc})))
+        locs_f.add(Node("QTX_LOCATION", name=loc,
+            props={"id": loc}))
 
     root.children = [quests_f, npcs_f, dialogs_f, groups_f, items_f, enemies_f, locs_f]
 
@@ -404,55 +575,108 @@ class App:
         self.root.minsize(900, 600)
         self.root.configure(bg=BG)
         self.font_size = 12
+        self._fonts = {}  # (family, size, weight) -> tkfont.Font
         self.node_root = None
         self.xml_tree = None
         self.qtx_lines = None
         self.filepath = None
         self.file_type = None  # "idx" / "qtx" / "shf"
-        self.tree_map = {}
-        self.modified = False
+        # iid "n<id(node)>" -> node; weak so dropped trees free their nodes
+        self.tree_map = weakref.WeakValueDictionary()
+        self._modified = False
+        self._stats_cache = (None, None)  # (node_root, counters)
+        self._search_after = None
+        self._reveal_after = None
+        self._pending_rows = []
+        self._pending_edits = {}  # (id(node), field) -> (handler, args)
+        self._edit_after_id = None
+        self._cs_frame = None; self._cs_rows = []  # create-string row pool
+        self._prop_frame = None; self._prop_rows = []  # property row pool
+        self._cs_expanded = False  # breakdown panel starts collapsed
+        self._render_node = None   # owner of the in-flight tail render
+        self._cs_cache = {}        # create string -> parsed (lbl, val) rows
+        self._dirty_xml = {}  # (id(node), tag) -> (node, tag, value)
+        self._entry_registry = {}  # Tk path -> (edit key, handler, args)
         self._build_ui()
+        # node_type -> view renderer; chat and the generic fallback are
+        # handled in _show itself.
+        self._view_dispatch = {
+            "NodeCharacter": self._view_character_idx,
+            "NodeQuest": self._view_quest_idx,
+            "QTX_NPC": self._view_npc_qtx,
+            "QTX_LOCATION": self._view_location_qtx,
+            "QTX_QUEST": self._view_quest_qtx,
+            "SHF_DIALOG": self._view_shf_dialog,
+            "SHF_ROOT": self._view_shf_root,
+        }
+        for t in QTX_SUB_NODE_TYPES:
+            self._view_dispatch[t] = self._view_quest_sub
         # Auto-load
         for name in ("TwoWorldsQuests.idx","TwoWorldsQuests.qtx"):
             p = os.path.join(SCRIPT_DIR, name)
             if os.path.exists(p): self._load_file(p); break
 
+    @property
+    def modified(self):
+        return self._modified
+
+    @modified.setter
+    def modified(self, value):
+        # Only dirty-flag *transitions* touch the window title (a synchronous
+        # Tk round-trip); repeated writes in a typing burst are no-ops.
+        if value != self._modified:
+            self._modified = value
+            if self.filepath:
+                name = os.path.basename(self.filepath)
+                star = "*" if value else ""
+                self.root.title(f"TW1 Quest Editor - {star}{name}")
+
+    def F(self, size, weight="normal", family="Segoe UI"):
+        # Shared tkfont.Font per (family, size, weight): Tk resolves the
+        # named font once instead of reparsing a tuple per widget.
+        key = (family, size, weight)
+        f = self._fonts.get(key)
+        if f is None:
+            f = self._fonts[key] = tkfont.Font(family=family, size=size,
+                                               weight=weight)
+        return f
+
     def _build_ui(self):
         top = tk.Frame(self.root, bg=BG3, height=44)
         top.pack(fill="x"); top.pack_propagate(False)
         tk.Label(top, text=f"TW1 Quest Editor v{VERSION}",
-                 font=("Segoe UI",12,"bold"), bg=BG3, fg=FG).pack(side="left", padx=14)
+                 font=self.F(12, "bold"), bg=BG3, fg=FG).pack(side="left", padx=14)
         self.status = tk.Label(top, text="No file loaded",
-                                font=("Segoe UI",9), bg=BG3, fg=FG_DIM)
+                                font=self.F(9), bg=BG3, fg=FG_DIM)
         self.status.pack(side="left", padx=16)
         rf = tk.Frame(top, bg=BG3); rf.pack(side="right", padx=10)
-        tk.Button(rf, text="\u2212", font=("Segoe UI",9,"bold"), width=2,
+        tk.Button(rf, text="\u2212", font=self.F(9, "bold"), width=2,
                  bg=BG2, fg=FG, relief="flat", cursor="hand2",
                  command=lambda: self._font(-1)).pack(side="left", padx=1)
-        self.font_lbl = tk.Label(rf, text="12", font=("Segoe UI",9), bg=BG3, fg=FG, width=3)
+        self.font_lbl = tk.Label(rf, text="12", font=self.F(9), bg=BG3, fg=FG, width=3)
         self.font_lbl.pack(side="left")
-        tk.Button(rf, text="+", font=("Segoe UI",9,"bold"), width=2,
+        tk.Button(rf, text="+", font=self.F(9, "bold"), width=2,
                  bg=BG2, fg=FG, relief="flat", cursor="hand2",
                  command=lambda: self._font(1)).pack(side="left", padx=1)
         # Toolbar
         bar = tk.Frame(self.root, bg=BG); bar.pack(fill="x", padx=8, pady=(5,2))
-        tk.Button(bar, text="Load", font=("Segoe UI",10,"bold"),
+        tk.Button(bar, text="Load", font=self.F(10, "bold"),
                  bg=ACCENT, fg=FG, relief="flat", padx=14, pady=3,
                  cursor="hand2", command=self._load).pack(side="left", padx=(0,4))
-        self.save_btn = tk.Button(bar, text="Save", font=("Segoe UI",10,"bold"),
+        self.save_btn = tk.Button(bar, text="Save", font=self.F(10, "bold"),
                  bg=GREEN, fg=BG, relief="flat", padx=14, pady=3,
                  cursor="hand2", command=self._save)
         self.save_btn.pack(side="left", padx=(0,10))
-        tk.Label(bar, text="Search:", font=("Segoe UI",10), bg=BG, fg=FG_DIM
+        tk.Label(bar, text="Search:", font=self.F(10), bg=BG, fg=FG_DIM
                  ).pack(side="left", padx=(8,4))
         self.search_var = tk.StringVar()
-        self.search_var.trace_add("write", lambda *a: self._search())
-        tk.Entry(bar, textvariable=self.search_var, font=("Segoe UI",10),
+        self.search_var.trace_add("write", self._on_search_change)
+        tk.Entry(bar, textvariable=self.search_var, font=self.F(10),
                  bg=CARD_BG, fg=FG, insertbackground=FG, relief="flat", width=25
                  ).pack(side="left", ipady=4, padx=(0,6))
-        self.search_lbl = tk.Label(bar, text="", font=("Segoe UI",9), bg=BG, fg=FG_DIM)
+        self.search_lbl = tk.Label(bar, text="", font=self.F(9), bg=BG, fg=FG_DIM)
         self.search_lbl.pack(side="left")
-        self.type_lbl = tk.Label(bar, text="", font=("Segoe UI",9,"bold"), bg=BG, fg=ORANGE)
+        self.type_lbl = tk.Label(bar, text="", font=self.F(9, "bold"), bg=BG, fg=ORANGE)
         self.type_lbl.pack(side="right", padx=10)
         # Panes
         self.paned = tk.PanedWindow(self.root, orient="horizontal", bg=BG,
@@ -462,7 +686,7 @@ class App:
         self.paned.add(tf, width=300, minsize=180)
         style = ttk.Style(); style.theme_use("clam")
         style.configure("T.Treeview", background=TREE_BG, foreground=TREE_FG,
-                        fieldbackground=TREE_BG, font=("Segoe UI",11),
+                        fieldbackground=TREE_BG, font=self.F(11),
                         rowheight=26, borderwidth=0)
         style.map("T.Treeview", background=[("selected",BG3)],
                   foreground=[("selected",GREEN)])
@@ -471,26 +695,83 @@ class App:
         self.tree.configure(yscrollcommand=tsb.set)
         tsb.pack(side="right", fill="y"); self.tree.pack(fill="both", expand=True)
         self.tree.bind("<<TreeviewSelect>>", self._on_select)
+        # One class-level binding serves every editable Entry row; rows only
+        # register themselves instead of each binding a fresh closure.
+        self.root.bind_class("Entry", "<KeyRelease>", self._on_entry_release)
         self.detail = tk.Frame(self.paned, bg=BG)
         self.paned.add(self.detail, minsize=400)
+        # Persistent detail chrome: the header strip and the canvas scroller
+        # survive view switches; _clear only empties their contents. Widget
+        # teardown/creation is the expensive part of a selection change.
+        self._header_area = tk.Frame(self.detail, bg=BG)
+        self._header_area.pack(fill="x")
+        self._detail_body = tk.Frame(self.detail, bg=BG)
+        self._detail_body.pack(fill="both", expand=True)
+        self._scroll_vsb = tk.Scrollbar(self._detail_body, orient="vertical")
+        self._scroll_canvas = tk.Canvas(self._detail_body, bg=BG,
+                                        highlightthickness=0,
+                                        yscrollcommand=self._scroll_vsb.set)
+        self._scroll_vsb.config(command=self._scroll_canvas.yview)
+        self._scroll_frame = tk.Frame(self._scroll_canvas, bg=BG)
+        self._scroll_frame.bind("<Configure>",
+            lambda e: self._scroll_canvas.configure(
+                scrollregion=self._scroll_canvas.bbox("all")))
+        self._scroll_canvas.create_window((0,0), window=self._scroll_frame,
+                                          anchor="nw", tags="inn")
+        self._scroll_canvas.bind("<Configure>",
+            lambda e: self._scroll_canvas.itemconfig("inn", width=e.width-20))
+        self._scroll_canvas.bind_all("<MouseWheel>",
+            lambda e: self._scroll_canvas.yview_scroll(
+                int(-1*(e.delta/120)), "units"))
         self._welcome()
 
+    def _on_entry_release(self, event):
+        w = event.widget
+        reg = self._entry_registry.get(str(w))
+        if reg is None: return
+        # Capture the text NOW: pooled entries are refilled with the next
+        # node's values on view switches, so a value read at flush time
+        # could belong to a different node (or field) entirely.
+        value = w.get()
+        # No-op KeyRelease (arrows, modifiers): nothing changed.
+        if getattr(w, "_last", None) == value: return
+        w._last = value
+        ekey, fn, args = reg
+        self._queue_edit(ekey, fn, *args, value)
+
+    def _clear(self):
+        self._render_node = None  # cancel any property tail render
+        self._entry_registry.clear()
+        for w in self._header_area.winfo_children(): w.destroy()
+        pooled = (self._cs_frame, self._prop_frame)
+        for w in self._scroll_frame.winfo_children():
+            # Pooled row containers are only hidden, never destroyed.
+            if w in pooled: w.pack_forget()
+            else: w.destroy()
+        keep = (self._scroll_canvas, self._scroll_vsb)
+        for w in self._detail_body.winfo_children():
+            if w not in keep: w.destroy()
+        self._scroll_vsb.pack_forget(); self._scroll_canvas.pack_forget()
+
     def _welcome(self):
-        for w in self.detail.winfo_children(): w.destroy()
-        f = tk.Frame(self.detail, bg=BG); f.pack(expand=True)
-        tk.Label(f, text="TW1 Quest Editor", font=("Segoe UI",18,"bold"),
+        self._clear()
+        f = tk.Frame(self._detail_body, bg=BG); f.pack(expand=True)
+        tk.Label(f, text="TW1 Quest Editor", font=self.F(18, "bold"),
                  bg=BG, fg=FG).pack(pady=(40,8))
         tk.Label(f, text=".idx (SOAP-XML) + .qtx (text) + .shf (read-only)",
-                 font=("Segoe UI",11), bg=BG, fg=FG_DIM).pack()
+                 font=self.F(11), bg=BG, fg=FG_DIM).pack()
         tk.Label(f, text="WhizzEdit still needed for compiling.",
-                 font=("Segoe UI",9), bg=BG, fg=FG_DIM).pack(pady=(16,0))
+                 font=self.F(9), bg=BG, fg=FG_DIM).pack(pady=(16,0))
 
     def _font(self, d):
         self.font_size = max(9, min(18, self.font_size + d))
         self.font_lbl.config(text=str(self.font_size))
-        ttk.Style().configure("T.Treeview", font=("Segoe UI",self.font_size-1),
+        ttk.Style().configure("T.Treeview", font=self.F(self.font_size-1),
                               rowheight=max(24,self.font_size*2))
-        self._on_select(None)
+        # Rebuild the detail pane only when something is actually shown;
+        # the welcome screen and an empty pane keep their widgets.
+        if self.tree.selection():
+            self._on_select(None)
 
     # ---- LOAD / SAVE ----
     def _load(self):
@@ -514,6 +795,7 @@ class App:
                 self.file_type = "shf"; self.xml_tree = None; self.qtx_lines = None
             else: raise ValueError(f"Unknown: {ext}")
             self.filepath = path; self._build_tree(); self.modified = False
+            self._dirty_xml.clear(); self._cs_cache.clear()
             s = self._stats(self.node_root); bn = os.path.basename(path)
             info = f"{bn}  |  {s['q']}Q  {s['c']}C  {s['d']}D  {s['e']}E"
             if ext == ".shf": info += "  (read-only)"
@@ -528,28 +810,57 @@ class App:
             import traceback; traceback.print_exc()
 
     def _stats(self, node):
+        # The tree only changes through the _edit_* handlers, which drop
+        # this cache; repeat loads/status refreshes reuse the last walk.
+        cached_node, cached = self._stats_cache
+        if cached_node is node:
+            return cached
         r = {"q":0,"c":0,"d":0,"e":0}
-        def walk(n):
+        bucket = _STAT_BUCKET
+        stack = [node]
+        while stack:
+            n = stack.pop()
             t = n.node_type
-            if t in ("NodeQuest","QTX_QUEST","SHF_QUEST"): r["q"] += 1
-            elif t in ("NodeCharacter","QTX_NPC"): r["c"] += 1
+            k = bucket.get(t)
+            if k: r[k] += 1
             elif "Dialog" in t and "Folder" not in t: r["d"] += 1
-            elif t in ("NodeEnemy",): r["e"] += 1
-            for c in n.children: walk(c)
-        walk(node); return r
+            stack.extend(n.children)
+        self._stats_cache = (node, r)
+        return r
 
     def _save(self):
         if not self.filepath or self.file_type == "shf": return
         bak = self.filepath + ".bak"
-        try: shutil.copy2(self.filepath, bak)
-        except: pass
         try:
+            # Hardlink backup is O(1) and copies nothing; the subsequent
+            # save writes a fresh file, so the link keeps the old bytes.
+            try: os.unlink(bak)
+            except FileNotFoundError: pass
+            os.link(self.filepath, bak)
+        except OSError:
+            # Filesystems without hardlinks (FAT/exFAT, some network shares)
+            try: shutil.copy2(self.filepath, bak)
+            except: pass
+        try:
+            # Materialise deferred XML edits now — the keystroke path only
+            # records dirty (node, tag) pairs.
+            for node, tag, value in self._dirty_xml.values():
+                self._update_xml(node, tag, value)
+            self._dirty_xml.clear()
+            # Write to a sibling temp file and rename over the original:
+            # an in-place truncate would wipe the hardlinked backup too.
+            tmp = self.filepath + ".tmp"
             if self.file_type == "idx":
-                self.xml_tree.write(self.filepath, encoding="utf-8", xml_declaration=False)
-                with open(self.filepath, "r", encoding="utf-8") as f: c = f.read()
-                with open(self.filepath, "w", encoding="utf-8-sig") as f: f.write(c)
+                # Serialise once into memory and write BOM + bytes in one
+                # pass, instead of write / read-back / rewrite-with-BOM.
+                buf = io.BytesIO()
+                self.xml_tree.write(buf, encoding="utf-8", xml_declaration=False)
+                with open(tmp, "wb") as f:
+                    f.write(b"\xef\xbb\xbf")
+                    f.write(buf.getbuffer())
             elif self.file_type == "qtx":
-                save_qtx(self.filepath, self.node_root, self.qtx_lines)
+                save_qtx(tmp, self.node_root, self.qtx_lines)
+            os.replace(tmp, self.filepath)
             self.modified = False
             self.status.config(text="Saved! (.bak backup created)", fg=GREEN)
         except Exception as e:
@@ -559,29 +870,28 @@ class App:
     def _build_tree(self):
         self.tree.delete(*self.tree.get_children()); self.tree_map.clear()
         if not self.node_root: return
-        # Only insert top-level + 1 depth, rest lazy
-        for child in self.node_root.children:
-            self._insert_node("", child, expand_depth=1)
+        # Only insert top-level + 1 depth, rest lazy — and feed the rows to
+        # Tk in idle-time chunks so a huge file never freezes the UI; the
+        # first rows are visible and scrollable while the rest stream in.
+        # (This replaces the unmap-during-build batching: an unmapped tree
+        # would hide exactly the progress the chunking provides.)
+        self._pending_rows = list(self.node_root.children)
         self.tree.bind("<<TreeviewOpen>>", self._on_expand)
+        self._build_tree_chunk()
+
+    def _build_tree_chunk(self):
+        pending = self._pending_rows
+        for node in pending[:100]:
+            self._insert_node("", node, expand_depth=1)
+        del pending[:100]
+        if pending:
+            self.root.after_idle(self._build_tree_chunk)
 
     def _insert_node(self, parent_tid, node, expand_depth=0):
-        icon = ICONS.get(node.node_type, "\u2022")
-        display = node.name or node.node_type
-        if "DialogText" in node.node_type:
-            txt = node.props.get("text") or ""
-            if txt:
-                display = txt[:55].replace("\n"," ")
-                if len(txt) > 55: display += "..."
-        if node.node_type == "QTX_QUEST": display = node.props.get("id", node.name)
-        if node.node_type in ("QTX_ACTION","QTX_FC","QTX_AOQ","QTX_REWARD","QTX_GIVER"):
-            raw = node.props.get("raw", node.name)
-            display = raw[:65]
-            if len(raw) > 65: display += "..."
-        if node.node_type == "SHF_DIALOG":
-            txt = node.props.get("text") or ""
-            display = txt[:60].replace("\n"," ").replace("\r","")
-            if len(txt) > 60: display += "..."
-        tid = self.tree.insert(parent_tid, "end", text=f"{icon}  {display}",
+        # Stable, derivable iid: _ensure_visible can address a node's row
+        # directly instead of scanning siblings.
+        tid = self.tree.insert(parent_tid, "end", iid=f"n{id(node)}",
+                                text=node._display or _node_display(node),
                                 open=False)
         self.tree_map[tid] = node
         if expand_depth > 0 and node.children:
@@ -604,62 +914,66 @@ class App:
                 self._insert_node(tid, c, expand_depth=0)
 
     # ---- SEARCH ----
+    def _on_search_change(self, *args):
+        # Debounce: only the last keystroke of a burst walks the tree.
+        if self._search_after is not None:
+            self.root.after_cancel(self._search_after)
+        self._search_after = self.root.after(150, self._run_search)
+
+    def _run_search(self):
+        self._search_after = None
+        self._search()
+
     def _search(self):
         q = self.search_var.get().strip().lower()
         if not q or len(q) < 2: self.search_lbl.config(text=""); return
         # Walk node tree to find matches
         hits = []
         def walk(node, path):
-            hay = " ".join(filter(None, [
-                node.name, node.props.get("id"), node.props.get("iid"),
-                node.props.get("text"), node.props.get("notes"),
-                node.props.get("create_string"), node.props.get("raw"),
-                node.props.get("action_type"), node.props.get("fc_type"),
-                node.props.get("npc"), node.props.get("target"),
-                node.props.get("object_items"),
-            ])).lower()
-            if q in hay: hits.append(path + [node])
+            # True propagates "limit reached" up without finishing subtrees.
+            if q in node.search_hay():
+                hits.append(path + [node])
+                if len(hits) >= 100: return True
+            child_path = path + [node]
             for c in node.children:
-                walk(c, path + [node])
-                if len(hits) >= 100: return  # Limit
+                if walk(c, child_path): return True
+            return False
         if self.node_root:
             for c in self.node_root.children:
-                walk(c, [])
-                if len(hits) >= 100: break
+                if walk(c, []): break
         self.search_lbl.config(text=f"{len(hits)} found")
         if hits:
-            # Ensure path to first hit is expanded in tree
-            target = hits[0][-1]
-            # Find or create tree item for target
-            tid = self._ensure_visible(target, hits[0][:-1])
-            if tid:
-                self.tree.selection_set(tid)
-                self.tree.see(tid)
+            # Reveal the first hit once the event queue drains: expansion,
+            # selection and scroll land in one idle callback instead of
+            # running ancestor-by-ancestor inside the trace handler.
+            if self._reveal_after is not None:
+                self.root.after_cancel(self._reveal_after)
+            self._reveal_after = self.root.after_idle(
+                self._reveal_hit, hits[0][-1], hits[0][:-1])
+
+    def _reveal_hit(self, target, ancestors):
+        self._reveal_after = None
+        tid = self._ensure_visible(target, ancestors)
+        if tid:
+            self.tree.selection_set(tid)
+            self.tree.see(tid)
 
     def _ensure_visible(self, target, ancestors):
         """Expand tree path to make target node visible, return its tid."""
-        # Find tid for each ancestor, expanding as needed
-        parent_tid = ""
+        # iids are derived from the node identity, so each ancestor's row is
+        # addressed directly — no sibling scans.
         for anc in ancestors:
-            # Find anc's tid among children of parent_tid
-            found = None
-            for cid in self.tree.get_children(parent_tid):
-                if self.tree_map.get(cid) is anc:
-                    found = cid; break
-            if not found: return None
+            tid = f"n{id(anc)}"
+            if not self.tree.exists(tid): return None
             # Expand if needed (triggers lazy load)
-            children = self.tree.get_children(found)
+            children = self.tree.get_children(tid)
             if len(children) == 1 and "placeholder" in self.tree.item(children[0], "tags"):
                 self.tree.delete(children[0])
                 for c in anc.children:
-                    self._insert_node(found, c, expand_depth=0)
-            self.tree.item(found, open=True)
-            parent_tid = found
-        # Now find target among children
-        for cid in self.tree.get_children(parent_tid):
-            if self.tree_map.get(cid) is target:
-                return cid
-        return None
+                    self._insert_node(tid, c, expand_depth=0)
+            self.tree.item(tid, open=True)
+        tid = f"n{id(target)}"
+        return tid if self.tree.exists(tid) else None
 
     # ---- SELECT ----
     def _on_select(self, event):
@@ -670,112 +984,123 @@ class App:
         self._show(node)
 
     def _show(self, node):
-        for w in self.detail.winfo_children(): w.destroy()
-        t = node.node_type
+        self._clear()
         dialogs = self._collect_dialogs(node)
-        if dialogs: self._view_chat(node, dialogs)
-        elif t == "NodeCharacter": self._view_character_idx(node)
-        elif t == "NodeQuest": self._view_quest_idx(node)
-        elif t == "QTX_NPC": self._view_npc_qtx(node)
-        elif t == "QTX_LOCATION": self._view_location_qtx(node)
-        elif t == "QTX_QUEST": self._view_quest_qtx(node)
-        elif t in ("QTX_ACTION","QTX_FC","QTX_AOQ","QTX_REWARD","QTX_GIVER"):
-            self._view_quest_sub(node)
-        elif t == "SHF_DIALOG": self._view_shf_dialog(node)
-        elif t == "SHF_ROOT": self._view_shf_root(node)
-        else: self._view_generic(node)
+        if dialogs:
+            self._view_chat(node, dialogs)
+        else:
+            self._view_dispatch.get(node.node_type, self._view_generic)(node)
 
     def _collect_dialogs(self, node):
-        r = []
-        if "DialogText" in node.node_type: r.append(node)
-        for c in node.children: r.extend(self._collect_dialogs(c))
-        return r
+        out = []
+        stack = [node]
+        while stack:
+            n = stack.pop()
+            if n.is_dialog: out.append(n)
+            stack.extend(reversed(n.children))  # keep pre-order
+        return out
 
     # ============================================================
     # VIEWS
     # ============================================================
     def _view_chat(self, parent, dialogs):
         fs = self.font_size
-        hdr = tk.Frame(self.detail, bg=BG3, padx=12, pady=8); hdr.pack(fill="x")
+        hdr = tk.Frame(self._header_area, bg=BG3, padx=12, pady=8); hdr.pack(fill="x")
         title = parent.name or parent.props.get("iid","Dialog")
         tk.Label(hdr, text=f"\U0001f4ac  {title}",
-                 font=("Segoe UI",fs+1,"bold"), bg=BG3, fg=FG).pack(anchor="w")
+                 font=self.F(fs+1, "bold"), bg=BG3, fg=FG).pack(anchor="w")
         sub = parent.props.get("text","")
         if sub and sub != title:
-            tk.Label(hdr, text=sub, font=("Segoe UI",fs-1), bg=BG3, fg=FG_DIM).pack(anchor="w")
+            tk.Label(hdr, text=sub, font=self.F(fs-1), bg=BG3, fg=FG_DIM).pack(anchor="w")
         tk.Label(hdr, text=f"{len(dialogs)} lines",
-                 font=("Segoe UI",fs-2), bg=BG3, fg=GREEN).pack(anchor="w")
-        canvas, cf = self._scrollable()
+                 font=self.F(fs-2), bg=BG3, fg=GREEN).pack(anchor="w")
+        editable = self.file_type != "shf"
+        # One Text widget with tagged runs instead of a frame + Text/Label
+        # per bubble: widget count stays constant however long the dialog is.
+        # Each dialog body carries a "d<i>" tag so in-place edits map back to
+        # their node.
+        vsb = tk.Scrollbar(self._detail_body, orient="vertical")
+        txt = tk.Text(self._detail_body, wrap="word", bg=BG, fg=FG,
+                      relief="flat", insertbackground=FG, borderwidth=0,
+                      highlightthickness=0, font=self.F(fs),
+                      padx=10, pady=8, yscrollcommand=vsb.set)
+        vsb.config(command=txt.yview)
+        vsb.pack(side="right", fill="y"); txt.pack(fill="both", expand=True)
+        txt.tag_configure("state", foreground=YELLOW, justify="center",
+                          font=self.F(fs-2), spacing1=10, spacing3=4)
+        txt.tag_configure("speaker_hero", foreground=BLUE, justify="right",
+                          font=self.F(fs-3, "bold"), lmargin1=50,
+                          spacing1=8)
+        txt.tag_configure("speaker_npc", foreground=GREEN,
+                          font=self.F(fs-3, "bold"), rmargin=50,
+                          spacing1=8)
+        txt.tag_configure("body_hero", background=CHAT_HERO, justify="right",
+                          lmargin1=50, lmargin2=50)
+        txt.tag_configure("body_npc", background=CHAT_NPC, rmargin=50)
         cur_state = None
-        for dnode in dialogs:
+        insert = txt.insert
+        for i, dnode in enumerate(dialogs):
             lector = dnode.props.get("lector_type","Default")
             dtype = dnode.props.get("type") or ""
             text = dnode.props.get("text") or "(empty)"
             if dtype and dtype != cur_state:
                 cur_state = dtype
-                sep = tk.Frame(cf, bg=BG, pady=4); sep.pack(fill="x", padx=8)
-                tk.Frame(sep, bg=FG_DIM, height=1).pack(fill="x", side="left", expand=True, pady=8)
-                tk.Label(sep, text=f"  {dtype}  ", font=("Segoe UI",fs-2),
-                         bg=BG, fg=YELLOW).pack(side="left")
-                tk.Frame(sep, bg=FG_DIM, height=1).pack(fill="x", side="left", expand=True, pady=8)
-            is_hero = lector in ("Hero","HERO")
-            bg_c = CHAT_HERO if is_hero else CHAT_NPC
-            brow = tk.Frame(cf, bg=BG); brow.pack(fill="x", padx=8, pady=2)
-            if is_hero:
-                tk.Frame(brow, bg=BG, width=50).pack(side="left", fill="y")
-                bubble = tk.Frame(brow, bg=bg_c, padx=10, pady=6)
-                bubble.pack(side="right", fill="x", expand=True)
-                tk.Label(bubble, text="Hero", font=("Segoe UI",fs-3,"bold"),
-                         bg=bg_c, fg=BLUE).pack(anchor="e")
-            else:
-                bubble = tk.Frame(brow, bg=bg_c, padx=10, pady=6)
-                bubble.pack(side="left", fill="x", expand=True)
-                tk.Frame(brow, bg=BG, width=50).pack(side="right", fill="y")
-                tk.Label(bubble, text="NPC", font=("Segoe UI",fs-3,"bold"),
-                         bg=bg_c, fg=GREEN).pack(anchor="w")
-            editable = self.file_type != "shf"
-            if editable:
-                tw = tk.Text(bubble, font=("Segoe UI",fs), bg=bg_c, fg=FG,
-                              wrap="word", relief="flat", insertbackground=FG,
-                              padx=2, pady=2, borderwidth=0, highlightthickness=0)
-                tw.insert("1.0", text)
-                nl = text.count("\n") + 1 + max(0, len(text)//55)
-                tw.config(height=min(10, max(1, nl)))
-                tw.pack(fill="x", pady=(2,0))
-                tw.bind("<KeyRelease>", lambda e, n=dnode, w=tw: self._edit_idx_text(n, w))
-            else:
-                tk.Label(bubble, text=text, font=("Segoe UI",fs), bg=bg_c, fg=FG,
-                         wraplength=500, justify="left").pack(fill="x", pady=(2,0), anchor="w")
+                insert("end", f"\u2014  {dtype}  \u2014\n", ("state",))
+            is_hero = lector in HERO_LECTORS
+            side = "hero" if is_hero else "npc"
+            label = "Hero" if is_hero else "NPC"
             parts = []
             iid = dnode.props.get("iid","")
             if iid: parts.append(f"#{iid}")
             cam = dnode.props.get("camera","")
             if cam and cam != "-1": parts.append(f"Cam:{cam}")
-            if parts:
-                tk.Label(bubble, text="  ".join(parts), font=("Consolas",fs-3),
-                         bg=bg_c, fg=FG_DIM).pack(anchor="e" if is_hero else "w", pady=(2,0))
+            if parts: label += "   " + "  ".join(parts)
+            insert("end", label + "\n", (f"speaker_{side}",))
+            # Each body is bracketed by gravity-anchored marks: unlike tags,
+            # they still cover text typed at the very edges of the line and
+            # survive (collapse to an empty range) when the whole line is
+            # deleted, so every edit reaches the node.
+            txt.mark_set(f"b{i}", "end-1c")
+            txt.mark_gravity(f"b{i}", "left")
+            insert("end", text + "\n", (f"body_{side}", f"d{i}"))
+            txt.mark_set(f"e{i}", "end-2c")
+            txt.mark_gravity(f"e{i}", "right")
+        if editable:
+            txt.bind("<KeyRelease>",
+                     lambda e, t=txt, d=dialogs: self._chat_key(t, d))
+        else:
+            txt.config(state="disabled")
+
+    def _chat_key(self, txt, dialogs):
+        # Resolve the bubble under the cursor and capture its text at
+        # keystroke time; the pending edit is keyed by the dialog node, so
+        # moving the cursor (or editing a second bubble) inside the debounce
+        # window can neither retarget nor coalesce away this edit.
+        compare = txt.compare
+        for i in range(len(dialogs)):
+            if (compare(f"b{i}", "<=", "insert")
+                    and compare("insert", "<=", f"e{i}")):
+                node = dialogs[i]
+                self._queue_edit((id(node), "text"), self._edit_idx_text,
+                                 node, txt.get(f"b{i}", f"e{i}"))
+                break
 
     def _view_character_idx(self, node):
         self._header(node, "\U0001f464 Character")
         _, frame = self._scrollable()
-        prio = ["iid","name","text","marker","sector","angle","party","guild",
-                "lector","create_string","exp","exp_level","remove_from_map",
-                "random_stuff","notes","rumors_dialog"]
-        self._show_props(frame, node, prio, editable=True)
+        self._show_props(frame, node, CHAR_PRIORITY, editable=True)
         cs = node.props.get("create_string","")
         if cs: self._show_cs(frame, cs)
 
     def _view_quest_idx(self, node):
         self._header(node, "\U0001f4dc Quest")
         _, frame = self._scrollable()
-        prio = ["iid","name","text","activation","group","guild",
-                "min_reputation","add_to_quest_log","can_be_failed","quest_state","notes"]
-        self._show_props(frame, node, prio, editable=True)
+        self._show_props(frame, node, QUEST_PRIORITY, editable=True)
         dialogs = self._collect_dialogs(node)
         if dialogs:
             tk.Frame(frame, bg=FG_DIM, height=1).pack(fill="x", pady=(10,6), padx=8)
             tk.Label(frame, text=f"\U0001f4ac {len(dialogs)} dialog lines",
-                     font=("Segoe UI",self.font_size-1), bg=BG, fg=BLUE).pack(anchor="w", padx=12)
+                     font=self.F(self.font_size-1), bg=BG, fg=BLUE).pack(anchor="w", padx=12)
 
     def _view_npc_qtx(self, node):
         self._header(node, "\U0001f464 NPC")
@@ -805,7 +1130,7 @@ class App:
         if node.children:
             tk.Frame(frame, bg=FG_DIM, height=1).pack(fill="x", pady=(10,6), padx=8)
             tk.Label(frame, text=f"\U0001f464 {len(node.children)} NPCs",
-                     font=("Segoe UI",self.font_size-1), bg=BG, fg=BLUE).pack(anchor="w", padx=12)
+                     font=self.F(self.font_size-1), bg=BG, fg=BLUE).pack(anchor="w", padx=12)
 
     def _view_quest_qtx(self, node):
         fs = self.font_size
@@ -814,7 +1139,7 @@ class App:
         for key, label in [("id","ID"),("group","Group"),("iid","IID"),
                             ("guild","Guild"),("min_rep","Min Rep"),("add_to_log","Quest Log")]:
             val = node.props.get(key, "(null)")
-            ed = key in ("group","guild","min_rep","add_to_log")
+            ed = key in QTX_QUEST_EDITABLE
             self._labeled_row(frame, node, key, label, val, ed)
         if node.children:
             tk.Frame(frame, bg=FG_DIM, height=1).pack(fill="x", pady=(10,6), padx=8)
@@ -824,20 +1149,22 @@ class App:
             colors = {"ACTION":ACCENT,"FC":BLUE,"AOQ":YELLOW,"REWARD":GREEN,"GIVER":ORANGE}
             sf = tk.Frame(frame, bg=BG); sf.pack(fill="x", padx=12, pady=(0,8))
             for k, v in counts.items():
-                tk.Label(sf, text=f"{v} {k}", font=("Segoe UI",fs-1,"bold"),
+                tk.Label(sf, text=f"{v} {k}", font=self.F(fs-1, "bold"),
                          bg=BG, fg=colors.get(k,FG_DIM)).pack(side="left", padx=(0,12))
             for child in node.children:
                 raw = child.props.get("raw", child.raw_line)
                 color = colors.get(child.node_type.replace("QTX_",""), FG)
                 sub_f = tk.Frame(frame, bg=BG); sub_f.pack(fill="x", padx=12, pady=1)
                 kw = raw.split(" ",1)[0]
-                tk.Label(sub_f, text=kw, font=("Consolas",fs-1,"bold"),
+                tk.Label(sub_f, text=kw, font=self.F(fs-1, "bold", "Consolas"),
                          bg=BG, fg=color, width=8, anchor="e").pack(side="left")
-                var = tk.StringVar(value=raw)
-                e = tk.Entry(sub_f, textvariable=var, font=("Consolas",fs-1),
+                e = tk.Entry(sub_f, font=self.F(fs-1, "normal", "Consolas"),
                             bg=CARD_BG, fg=FG, insertbackground=FG, relief="flat")
+                e.insert(0, raw)
                 e.pack(side="left", fill="x", expand=True, padx=(6,0), ipady=2)
-                e.bind("<KeyRelease>", lambda ev, n=child, v=var: self._edit_qtx_raw(n, v))
+                e._last = raw
+                self._entry_registry[str(e)] = (
+                    (id(child), "raw"), self._edit_qtx_raw, (child,))
 
     def _view_quest_sub(self, node):
         kw = node.node_type.replace("QTX_","")
@@ -848,13 +1175,15 @@ class App:
             if key == "raw" or val is None: continue
             self._labeled_row(frame, node, key, key, val, False)
         tk.Frame(frame, bg=FG_DIM, height=1).pack(fill="x", pady=(10,6), padx=8)
-        tk.Label(frame, text="Raw line:", font=("Segoe UI",self.font_size-1,"bold"),
+        tk.Label(frame, text="Raw line:", font=self.F(self.font_size-1, "bold"),
                  bg=BG, fg=YELLOW).pack(anchor="w", padx=12)
-        var = tk.StringVar(value=node.props.get("raw",""))
-        e = tk.Entry(frame, textvariable=var, font=("Consolas",self.font_size-1),
+        e = tk.Entry(frame, font=self.F(self.font_size-1, "normal", "Consolas"),
                     bg=CARD_BG, fg=FG, insertbackground=FG, relief="flat")
+        e.insert(0, node.props.get("raw",""))
         e.pack(fill="x", padx=12, ipady=4)
-        e.bind("<KeyRelease>", lambda ev, n=node, v=var: self._edit_qtx_raw(n, v))
+        e._last = node.props.get("raw","")
+        self._entry_registry[str(e)] = (
+            (id(node), "raw"), self._edit_qtx_raw, (node,))
 
     def _view_shf_dialog(self, node):
         fs = self.font_size
@@ -864,13 +1193,13 @@ class App:
         obj_id = node.props.get("obj_id","")
         if obj_id:
             row = tk.Frame(frame, bg=BG); row.pack(fill="x", padx=8, pady=2)
-            tk.Label(row, text="Object ID", font=("Segoe UI",fs-1,"bold"),
+            tk.Label(row, text="Object ID", font=self.F(fs-1, "bold"),
                      bg=BG, fg=FG_DIM, width=14, anchor="e").pack(side="left")
-            tk.Label(row, text=obj_id, font=("Consolas",fs-1),
+            tk.Label(row, text=obj_id, font=self.F(fs-1, "normal", "Consolas"),
                      bg=BG, fg=FG).pack(side="left", padx=(6,0))
         if text:
             tk.Frame(frame, bg=FG_DIM, height=1).pack(fill="x", pady=(8,6), padx=8)
-            txt_w = tk.Text(frame, font=("Segoe UI",fs), bg=CARD_BG, fg=FG,
+            txt_w = tk.Text(frame, font=self.F(fs), bg=CARD_BG, fg=FG,
                             wrap="word", relief="flat", padx=10, pady=10,
                             borderwidth=0, highlightthickness=0, state="normal")
             txt_w.insert("1.0", text)
@@ -884,15 +1213,15 @@ class App:
         self._header(node, "\U0001f3ae SHF File")
         _, frame = self._scrollable()
         tk.Label(frame, text="Read-only (.NET BinaryFormatter)",
-                 font=("Segoe UI",fs,"bold"), bg=BG, fg=RED).pack(anchor="w", padx=12, pady=(8,4))
+                 font=self.F(fs, "bold"), bg=BG, fg=RED).pack(anchor="w", padx=12, pady=(8,4))
         tk.Label(frame, text="Use WhizzEdit to export as .idx for full editing.",
-                 font=("Segoe UI",fs-1), bg=BG, fg=FG_DIM).pack(anchor="w", padx=12)
+                 font=self.F(fs-1), bg=BG, fg=FG_DIM).pack(anchor="w", padx=12)
         for key, val in node.props.items():
             if key == "info": continue
             row = tk.Frame(frame, bg=BG); row.pack(fill="x", padx=8, pady=2)
-            tk.Label(row, text=key, font=("Segoe UI",fs-1,"bold"),
+            tk.Label(row, text=key, font=self.F(fs-1, "bold"),
                      bg=BG, fg=FG_DIM, width=14, anchor="e").pack(side="left")
-            tk.Label(row, text=val, font=("Consolas",fs-1),
+            tk.Label(row, text=val, font=self.F(fs-1, "normal", "Consolas"),
                      bg=BG, fg=GREEN).pack(side="left", padx=(6,0))
 
     def _view_generic(self, node):
@@ -910,117 +1239,236 @@ class App:
     # ============================================================
     def _header(self, node, prefix):
         fs = self.font_size
-        h = tk.Frame(self.detail, bg=BG3, padx=12, pady=8); h.pack(fill="x")
+        h = tk.Frame(self._header_area, bg=BG3, padx=12, pady=8); h.pack(fill="x")
         name = node.name or node.props.get("iid","") or node.props.get("id","")
         tk.Label(h, text=f"{prefix}:  {name}",
-                 font=("Segoe UI",fs+1,"bold"), bg=BG3, fg=FG).pack(anchor="w")
+                 font=self.F(fs+1, "bold"), bg=BG3, fg=FG).pack(anchor="w")
         txt = node.props.get("text") or ""
         if txt and txt != name and len(txt) < 200:
-            tk.Label(h, text=txt, font=("Segoe UI",fs-1), bg=BG3, fg=FG_DIM).pack(anchor="w")
+            tk.Label(h, text=txt, font=self.F(fs-1), bg=BG3, fg=FG_DIM).pack(anchor="w")
 
     def _scrollable(self):
-        canvas = tk.Canvas(self.detail, bg=BG, highlightthickness=0)
-        vsb = tk.Scrollbar(self.detail, orient="vertical", command=canvas.yview)
-        frame = tk.Frame(canvas, bg=BG)
-        frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-        canvas.create_window((0,0), window=frame, anchor="nw", tags="inn")
-        canvas.bind("<Configure>", lambda e: canvas.itemconfig("inn", width=e.width-20))
-        canvas.configure(yscrollcommand=vsb.set)
-        vsb.pack(side="right", fill="y"); canvas.pack(side="left", fill="both", expand=True)
-        canvas.bind_all("<MouseWheel>",
-            lambda e: canvas.yview_scroll(int(-1*(e.delta/120)), "units"))
-        return canvas, frame
+        self._scroll_vsb.pack(side="right", fill="y")
+        self._scroll_canvas.pack(side="left", fill="both", expand=True)
+        self._scroll_canvas.yview_moveto(0)
+        return self._scroll_canvas, self._scroll_frame
 
     def _labeled_row(self, parent, node, key, label, value, editable):
         fs = self.font_size
         row = tk.Frame(parent, bg=BG); row.pack(fill="x", padx=8, pady=2)
-        tk.Label(row, text=label, font=("Segoe UI",fs-1,"bold"),
+        tk.Label(row, text=label, font=self.F(fs-1, "bold"),
                  bg=BG, fg=FG_DIM, width=14, anchor="e").pack(side="left")
         if editable and self.file_type != "shf":
-            var = tk.StringVar(value=str(value))
-            e = tk.Entry(row, textvariable=var, font=("Consolas",fs-1),
+            e = tk.Entry(row, font=self.F(fs-1, "normal", "Consolas"),
                         bg=CARD_BG, fg=FG, insertbackground=FG, relief="flat")
+            e.insert(0, str(value))
+            e._last = str(value)
             e.pack(side="left", fill="x", expand=True, padx=(6,0), ipady=3)
-            e.bind("<KeyRelease>", lambda ev, n=node, k=key, v=var: self._edit_qtx_prop(n, k, v))
+            self._entry_registry[str(e)] = (
+                (id(node), key), self._edit_qtx_prop, (node, key))
         else:
-            tk.Label(row, text=str(value), font=("Consolas",fs-1),
+            tk.Label(row, text=self._ro_text(value), font=self.F(fs-1, "normal", "Consolas"),
                      bg=BG, fg=FG, anchor="w", wraplength=480).pack(side="left", padx=(6,0))
 
+    @staticmethod
+    def _ro_text(value):
+        # Bound what Tk has to measure for wrapped read-only labels; values
+        # beyond 240 chars are previews, not editors.
+        s = str(value)
+        return s if len(s) <= 240 else s[:237] + "..."
+
     def _show_props(self, frame, node, priority, editable=False):
-        edit_fields = {"text","name","notes","create_string","sector","angle",
-                    "party","guild","lector","activation","min_reputation",
-                    "exp","exp_level","random_stuff","remove_from_map",
-                    "can_be_failed","add_to_quest_log","quest_state","marker","rumors_dialog"}
-        shown = set()
-        for k in priority:
-            v = node.props.get(k)
-            if v is not None and k not in HIDDEN_FIELDS:
-                self._prop_row(frame, node, k, v, editable=(editable and k in edit_fields))
-                shown.add(k)
-        for k, v in node.props.items():
-            if k not in shown and k not in HIDDEN_FIELDS and v is not None:
-                self._prop_row(frame, node, k, v, editable=(editable and k in edit_fields))
+        props = node.props
+        pset = PRIORITY_SETS.get(priority) or frozenset(priority)
+        ordered = [k for k in priority if k in props]
+        ordered += [k for k in props if k not in pset]
+        rows = [(k, props[k]) for k in ordered
+                if props[k] is not None and k not in HIDDEN_FIELDS]
+        # Rows come from a pooled container that survives view switches
+        # (repacked here, so it keeps its place ahead of panels added after
+        # this call). First screenful renders synchronously; the tail
+        # streams in via after_idle so property-heavy nodes never stall.
+        if self._prop_frame is None:
+            self._prop_frame = tk.Frame(self._scroll_frame, bg=BG)
+        self._prop_frame.pack(fill="x")
+        for i, (k, v) in enumerate(rows[:12]):
+            self._render_prop_row(i, node, k, v,
+                                  editable and k in EDIT_FIELDS)
+        # Hide everything past the synchronous screenful: rows still holding
+        # the previous node's content must not stay visible while the tail
+        # ticks repack them with fresh data.
+        for r, _, _, _ in self._prop_rows[min(len(rows), 12):]:
+            r.pack_forget()
+        if len(rows) > 12:
+            self._render_node = node
+            self.root.after_idle(self._render_props_tail,
+                                 node, rows, 12, editable)
+
+    def _render_props_tail(self, node, rows, i, editable):
+        if self._render_node is not node:
+            return  # selection moved on
+        for j in range(i, min(i + 8, len(rows))):
+            k, v = rows[j]
+            self._render_prop_row(j, node, k, v,
+                                  editable and k in EDIT_FIELDS)
+        if i + 8 < len(rows):
+            self.root.after_idle(self._render_props_tail,
+                                 node, rows, i + 8, editable)
+
+    def _get_prop_row(self, i):
+        pool = self._prop_rows
+        while len(pool) <= i:
+            r = tk.Frame(self._prop_frame, bg=BG)
+            k = tk.Label(r, bg=BG, fg=FG_DIM, width=18, anchor="e")
+            k.pack(side="left")
+            v = tk.Label(r, bg=BG, fg=FG, anchor="w", wraplength=480)
+            e = tk.Entry(r, bg=CARD_BG, fg=FG, insertbackground=FG,
+                         relief="flat")
+            pool.append((r, k, v, e))
+        return pool[i]
+
+    def _render_prop_row(self, i, node, key, value, editable):
+        # Pooled row: reconfigure texts and show the Entry or the Label.
+        fs = self.font_size
+        r, klbl, vlbl, entry = self._get_prop_row(i)
+        klbl.config(text=key, font=self.F(fs-1, "bold"))
+        if editable and self.file_type != "shf":
+            vlbl.pack_forget()
+            entry.delete(0, "end"); entry.insert(0, str(value))
+            entry._last = str(value)
+            entry.config(font=self.F(fs-1, "normal", "Consolas"))
+            entry.pack(side="left", fill="x", expand=True, padx=(6,0), ipady=3)
+            self._entry_registry[str(entry)] = (
+                (id(node), key), self._edit_idx_prop, (node, key))
+        else:
+            entry.pack_forget()
+            vlbl.config(text=self._ro_text(value),
+                        font=self.F(fs-1, "normal", "Consolas"))
+            vlbl.pack(side="left", padx=(6,0))
+        r.pack(fill="x", padx=8, pady=2)
 
     def _prop_row(self, parent, node, key, value, editable=False):
         fs = self.font_size
         row = tk.Frame(parent, bg=BG); row.pack(fill="x", padx=8, pady=2)
-        tk.Label(row, text=key, font=("Segoe UI",fs-1,"bold"),
+        tk.Label(row, text=key, font=self.F(fs-1, "bold"),
                  bg=BG, fg=FG_DIM, width=18, anchor="e").pack(side="left")
         if editable:
-            var = tk.StringVar(value=str(value))
-            e = tk.Entry(row, textvariable=var, font=("Consolas",fs-1),
+            e = tk.Entry(row, font=self.F(fs-1, "normal", "Consolas"),
                         bg=CARD_BG, fg=FG, insertbackground=FG, relief="flat")
+            e.insert(0, str(value))
+            e._last = str(value)
             e.pack(side="left", fill="x", expand=True, padx=(6,0), ipady=3)
-            e.bind("<KeyRelease>", lambda ev, n=node, k=key, v=var: self._edit_idx_prop(n, k, v))
+            self._entry_registry[str(e)] = (
+                (id(node), key), self._edit_idx_prop, (node, key))
         else:
-            tk.Label(row, text=str(value), font=("Consolas",fs-1),
+            tk.Label(row, text=self._ro_text(value), font=self.F(fs-1, "normal", "Consolas"),
                      bg=BG, fg=FG, anchor="w", wraplength=480).pack(side="left", padx=(6,0))
 
+    def _toggle_cs(self):
+        self._cs_expanded = not self._cs_expanded
+        self._on_select(None)
+
     def _show_cs(self, frame, cs):
         fs = self.font_size
         tk.Frame(frame, bg=FG_DIM, height=1).pack(fill="x", pady=(10,6), padx=8)
-        tk.Label(frame, text="Create String:", font=("Segoe UI",fs,"bold"),
-                 bg=BG, fg=YELLOW).pack(anchor="w", padx=12)
-        if "#" in cs: model, equip = cs.split("#",1)
-        else: model, equip = cs, ""
-        m = re.match(r"(\w+)\((\d+)\)", model)
-        items = [("Model", m.group(1) if m else model)]
-        if m: items.append(("Level", m.group(2)))
-        if equip:
-            for n, p in re.findall(r"(\w+)\(([^)]+)\)", equip):
+        # Collapsed by default: selections only pay for the toggle row until
+        # someone actually opens the breakdown.
+        arrow = "\u25be" if self._cs_expanded else "\u25b8"
+        tk.Button(frame, text=f"{arrow} Create String", font=self.F(fs, "bold"),
+                  bg=BG, fg=YELLOW, relief="flat", anchor="w", cursor="hand2",
+                  command=self._toggle_cs).pack(anchor="w", padx=10)
+        if not self._cs_expanded:
+            if self._cs_frame is not None: self._cs_frame.pack_forget()
+            return
+        items = self._cs_cache.get(cs)
+        if items is None:
+            name, level, equips = _parse_cs(cs)
+            items = [("Model", name)]
+            if level is not None: items.append(("Level", level))
+            for n, p in equips:
                 items.append(("Equip", f"{n} ({p})"))
-        for lbl, val in items:
-            r = tk.Frame(frame, bg=BG); r.pack(fill="x", padx=18, pady=1)
-            tk.Label(r, text=lbl, font=("Segoe UI",fs-1,"bold"),
-                     bg=BG, fg=FG_DIM, width=10, anchor="e").pack(side="left")
-            tk.Label(r, text=val, font=("Consolas",fs-1),
-                     bg=BG, fg=GREEN).pack(side="left", padx=(6,0))
+            self._cs_cache[cs] = items
+        # Rows come from a pool that survives view switches; this render
+        # only rewrites texts/fonts and hides what it doesn't need.
+        if self._cs_frame is None:
+            self._cs_frame = tk.Frame(self._scroll_frame, bg=BG)
+        pool = self._cs_rows
+        while len(pool) < len(items):
+            r = tk.Frame(self._cs_frame, bg=BG)
+            k = tk.Label(r, bg=BG, fg=FG_DIM, width=10, anchor="e")
+            v = tk.Label(r, bg=BG, fg=GREEN)
+            k.pack(side="left"); v.pack(side="left", padx=(6,0))
+            pool.append((r, k, v))
+        f_key = self.F(fs-1, "bold")
+        f_val = self.F(fs-1, "normal", "Consolas")
+        for (r, k, v), (lbl, val) in zip(pool, items):
+            k.config(text=lbl, font=f_key)
+            v.config(text=val, font=f_val)
+            r.pack(fill="x", padx=10, pady=1)
+        for r, _, _ in pool[len(items):]:
+            r.pack_forget()
+        self._cs_frame.pack(fill="x", padx=8)
 
     # ============================================================
     # EDITING
     # ============================================================
-    def _edit_idx_text(self, node, widget):
-        new = widget.get("1.0","end-1c")
-        if new != node.props.get("text") or "":
-            node.props["text"] = new; self._update_xml(node, "text", new); self.modified = True
-    def _edit_idx_prop(self, node, key, var):
-        new = var.get()
+    def _queue_edit(self, ekey, fn, *args):
+        # Trailing-edge debounce for <KeyRelease> edits: keep only the
+        # latest pending edit per (node, field); the handlers read the
+        # widget/variable at flush time, so the final value wins.
+        self._pending_edits[ekey] = (fn, args)
+        if self._edit_after_id is None:
+            self._edit_after_id = self.root.after(120, self._flush_edits)
+
+    def _flush_edits(self):
+        self._edit_after_id = None
+        pending = self._pending_edits
+        self._pending_edits = {}
+        for fn, args in pending.values():
+            fn(*args)  # values were captured at event time; no widget reads
+
+    def _mark_modified(self):
+        self.modified = True
+        self._stats_cache = (None, None)
+
+    def _edit_idx_text(self, node, new):
+        # The old guard read `new != get("text") or ""` — precedence made it
+        # `(new != ...) or ""`, so a None text prop compared unequal to ""
+        # and every no-op KeyRelease rewrote the XML.
+        if new != (node.props.get("text") or ""):
+            node.props["text"] = new; node._hay = None; node._display = None
+            self._queue_xml(node, "text", new); self._mark_modified()
+    def _edit_idx_prop(self, node, key, new):
         if new != node.props.get(key,""):
-            node.props[key] = new
-            self._update_xml(node, "n" if key == "name" else key, new); self.modified = True
+            node.props[key] = new; node._hay = None
+            self._queue_xml(node, "n" if key == "name" else key, new)
+            self._mark_modified()
+    def _queue_xml(self, node, tag, value):
+        # XML sync is deferred to save; props already hold the live value,
+        # so the keystroke path is two hash operations. Nodes with no
+        # backing element (qtx/shf) never enter the queue at all.
+        if node.element is None: return
+        self._dirty_xml[(id(node), tag)] = (node, tag, value)
+
     def _update_xml(self, node, tag, value):
+        # Keystroke-hot: one lazy dict build per node, then O(1) per sync.
         elem = node.element
         if elem is None: return
-        for child in elem:
-            if _strip(child.tag) == tag: child.text = value; return
-    def _edit_qtx_prop(self, node, key, var):
-        new = var.get()
+        by_tag = node._child_by_tag
+        if by_tag is None:
+            by_tag = node._child_by_tag = {}
+            for c in elem:
+                by_tag.setdefault(_strip(c.tag), c)  # first match, like the scan
+        child = by_tag.get(tag)
+        if child is not None: child.text = value
+    def _edit_qtx_prop(self, node, key, new):
         if new != node.props.get(key,""):
-            node.props[key] = new if new != "(null)" else None; self.modified = True
-    def _edit_qtx_raw(self, node, var):
-        new = var.get()
+            node.props[key] = new if new != "(null)" else None
+            node._hay = None; self._mark_modified()
+    def _edit_qtx_raw(self, node, new):
         if new != node.props.get("raw",""):
-            node.props["raw"] = new; node.raw_line = new; self.modified = True
+            node.props["raw"] = new; node.raw_line = new
+            node._hay = None; node._display = None; self._mark_modified()
 
     def run(self):
         self.root.mainloop()